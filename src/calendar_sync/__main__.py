@@ -1,28 +1,123 @@
 """CLI entry point for Calendar Sync application."""
 
 import argparse
+import hashlib
 import sys
-from datetime import datetime, timedelta
-from pathlib import Path
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta, timezone
+from itertools import chain
+from typing import TYPE_CHECKING
 
-# Initialize SSL truststore early, before any HTTPS imports
-from .utils.ssl_utils import init_ssl
-init_ssl()
-
-from .auth.msal_auth import M365AuthProvider
-from .auth.selenium_auth import SeleniumEWSAuth
-from .auth.token_cache import TokenCacheManager
-from .config import M365Config, config, sync_config
-from .readers.ews_selenium_reader import EWSSeleniumReader
-from .readers.m365_reader import M365CalendarReader
 from .utils.date_utils import get_sync_window
 from .utils.exceptions import CalendarSyncError
 from .utils.logging import setup_logging
+from .utils.ssl_utils import init_ssl
+
+if TYPE_CHECKING:
+    from .auth.msal_auth import M365AuthProvider
+
+
+# M365 auth providers shared by accounts on the same tenant/app/mailbox
+_m365_auth_cache: dict[tuple, "M365AuthProvider"] = {}
+_m365_auth_lock = threading.Lock()
+
+# Readers and writers memoized by (account name, account type) within a run
+_reader_cache: dict[tuple[str, str], object] = {}
+_writer_cache: dict[tuple[str, str], object] = {}
+_client_lock = threading.Lock()
+
+
+def _get_m365_auth(account, cache_manager) -> "M365AuthProvider":
+    """Get a shared M365AuthProvider for an AccountConfig.
+
+    Providers are memoized by (tenant_id, client_id, secret digest, primary_email)
+    so sources and the target that use the same app registration reuse one MSAL
+    client application and its in-memory token state. The secret is part of the
+    key because it selects between client-credentials and device-code flows; only
+    its digest is kept.
+    """
+    from .auth.msal_auth import M365AuthProvider
+    from .config import M365Config
+    from .utils.http import get_session
+
+    secret_digest = (
+        hashlib.sha256(account.client_secret.encode()).hexdigest()
+        if account.client_secret else None
+    )
+    key = (account.tenant_id, account.client_id, secret_digest, account.primary_email)
+    with _m365_auth_lock:
+        m365_auth = _m365_auth_cache.get(key)
+        if m365_auth is None:
+            # Use model_construct to bypass environment variable loading
+            m365_cfg = M365Config.model_construct(
+                tenant_id=account.tenant_id,
+                client_id=account.client_id,
+                client_secret=account.client_secret,
+                primary_email=account.primary_email,
+            )
+            m365_auth = M365AuthProvider(m365_cfg, cache_manager, http_client=get_session())
+            _m365_auth_cache[key] = m365_auth
+        return m365_auth
 
 
 def _create_reader(account, cache_manager):
-    """Create a calendar reader from an AccountConfig."""
+    """Get the calendar reader for an AccountConfig, creating it on first use.
+
+    Readers are memoized by (name, type) for the lifetime of the process.
+    """
+    key = (account.name, account.type)
+    with _client_lock:
+        reader = _reader_cache.get(key)
+    if reader is None:
+        # Network clients are about to be created; make sure the truststore is in place
+        init_ssl()
+        # Build outside the lock: interactive logins can take minutes
+        reader = _build_reader(account, cache_manager)
+        with _client_lock:
+            reader = _reader_cache.setdefault(key, reader)
+    return reader
+
+
+def _create_writer(account, cache_manager):
+    """Get the calendar writer for an AccountConfig, creating it on first use.
+
+    The writer shares its M365AuthProvider with any reader of the same identity.
+
+    Raises:
+        ValueError: If the account type cannot be written to
+    """
+    key = (account.name, account.type)
+    with _client_lock:
+        writer = _writer_cache.get(key)
+    if writer is None:
+        if not account.type.startswith("m365"):
+            raise ValueError(f"Writing to {account.type} not supported")
+        init_ssl()
+        from .utils.http import get_session
+        from .writers.m365_writer import M365CalendarWriter
+
+        # Build outside the lock, as _create_reader does, so lookups for other
+        # accounts don't wait on MSAL and HTTP session setup
+        m365_auth = _get_m365_auth(account, cache_manager)
+        writer = M365CalendarWriter(
+            m365_auth, primary_email=account.primary_email, session=get_session()
+        )
+        with _client_lock:
+            writer = _writer_cache.setdefault(key, writer)
+    return writer
+
+
+def _build_reader(account, cache_manager):
+    """Create a calendar reader from an AccountConfig.
+
+    Reader and auth modules are imported per account type so that a run
+    which only touches M365 accounts never loads Selenium, and vice versa.
+    """
     if account.type == "ews_selenium":
+        from .auth.selenium_auth import SeleniumEWSAuth
+        from .readers.ews_selenium_reader import EWSSeleniumReader
+
         if not account.server_url:
             raise ValueError(f"Account '{account.name}' requires server_url")
         base_url = account.server_url.split("/EWS")[0]
@@ -33,6 +128,7 @@ def _create_reader(account, cache_manager):
             browser=account.browser,
             use_browser_api=account.use_browser_api,
             headless=account.headless,
+            login_timeout=account.login_timeout,
         )
         # Build a minimal EWSConfig-like object from account
         from .config import EWSConfig
@@ -46,60 +142,145 @@ def _create_reader(account, cache_manager):
         )
         return EWSSeleniumReader(selenium_auth, ews_cfg)
     elif account.type in ("m365", "m365_read"):
-        # Use model_construct to bypass environment variable loading
-        m365_cfg = M365Config.model_construct(
-            tenant_id=account.tenant_id,
-            client_id=account.client_id,
-            client_secret=account.client_secret,
-            primary_email=account.primary_email,
-        )
-        m365_auth = M365AuthProvider(m365_cfg, cache_manager)
+        from .readers.m365_reader import M365CalendarReader
+
+        m365_auth = _get_m365_auth(account, cache_manager)
         return M365CalendarReader(m365_auth, primary_email=account.primary_email)
     else:
         raise ValueError(f"Unknown account type: {account.type}")
 
 
-def _filter_events_by_day(events: list, account, logger=None) -> list:
-    """Filter events based on include_days and exclude_days settings."""
+# Upper bound on concurrent source reads (each may hold a browser or HTTP pool)
+MAX_READ_WORKERS = 8
+
+# Bitmask with all seven weekdays allowed (see AccountConfig.day_mask)
+ALL_DAYS_MASK = 0b1111111
+
+
+def _event_key(event) -> tuple[str, str]:
+    """Build the (subject, "YYYY-MM-DDTHH:MM") key used for dedup against the target.
+
+    Uses isoformat(timespec="minutes") on the naive wall-clock time, which
+    matches the target's dateTime[:16] without strftime's format parsing.
+    """
+    return (event.subject, event.start.replace(tzinfo=None).isoformat(timespec="minutes"))
+
+
+def _partition_new(keyed_events, existing) -> tuple[list, list]:
+    """Split events into those missing from the target and those already there.
+
+    Args:
+        keyed_events: Iterable of (event, dedup key) pairs (see _event_key)
+        existing: Container of target dedup keys
+
+    Returns:
+        Tuple of (events to create, events already present)
+    """
+    to_create = []
+    skipped = []
+    for event, key in keyed_events:
+        (skipped if key in existing else to_create).append(event)
+    return to_create, skipped
+
+
+def _iso_date(value: str) -> datetime:
+    """argparse type for YYYY-MM-DD arguments, returning midnight UTC of that day."""
+    try:
+        day = date.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(
+            f"invalid date '{value}', use YYYY-MM-DD (e.g., 2026-02-04)"
+        ) from None
+    return datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+
+
+def _process_events(events, account, skip_subjects: frozenset, logger=None) -> list:
+    """Filter and decorate one source's events in a single pass.
+
+    Drops events whose subject is in skip_subjects or whose weekday is excluded
+    by the account's include_days/exclude_days, then applies the account's
+    subject prefix and category to the remaining events in place.
+
+    Args:
+        events: Events read from the source account
+        account: AccountConfig of the source
+        skip_subjects: Normalized (lowercase, stripped) subjects to drop
+        logger: Optional logger for day-filter messages
+
+    Returns:
+        List of kept events
+    """
     import logging
     log = logger or logging.getLogger(__name__)
 
-    if not account.include_days and not account.exclude_days:
-        return events
-
+    day_mask = account.day_mask
+    check_days = day_mask != ALL_DAYS_MASK
     day_names = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+    prefix = account.prefix
+    prefix_sp = f"{prefix} " if prefix else None
+    plen = len(prefix) if prefix else 0
+    category = account.category
+
+    # Nothing to filter or decorate: keep every event as-is
+    if not (skip_subjects or check_days or prefix_sp or category):
+        return list(events)
+
     filtered = []
     excluded_count = 0
 
-    for event in events:
-        # Get the day of week (0=Monday, 6=Sunday)
-        day_of_week = event.start.weekday()
-        day_name = day_names[day_of_week]
-
-        # If include_days is set, only include those days
-        if account.include_days:
-            if day_of_week not in account.include_days:
-                log.info(f"  ⏭️  Skipping '{event.subject}' - {day_name} not in include_days")
+    for e in events:
+        # Apply skip_subjects filter (no normalization needed when the set is empty)
+        if skip_subjects and e.subject.lower().strip() in skip_subjects:
+            continue
+
+        # Apply day filtering (include_days / exclude_days), 0=Monday, 6=Sunday
+        if check_days:
+            day_of_week = e.start.weekday()
+            if not (day_mask >> day_of_week) & 1:
+                if account.include_days and day_of_week not in account.include_days:
+                    reason = "not in include_days"
+                else:
+                    reason = "in exclude_days"
+                log.info(
+                    "  ⏭️  Skipping '%s' - %s %s",
+                    e.subject, day_names[day_of_week], reason,
+                )
                 excluded_count += 1
                 continue
 
-        # If exclude_days is set, exclude those days
-        if account.exclude_days:
-            if day_of_week in account.exclude_days:
-                log.info(f"  ⏭️  Skipping '{event.subject}' - {day_name} in exclude_days")
-                excluded_count += 1
-                continue
+        # Apply prefix and category
+        if prefix_sp and e.subject[:plen] != prefix:
+            e.subject = prefix_sp + e.subject
+        if category:
+            categories = e.categories
+            if category not in categories:
+                categories.append(category)
 
-        filtered.append(event)
+        filtered.append(e)
 
     if excluded_count > 0:
-        log.info(f"  📅 Day filter: {excluded_count} event(s) excluded, {len(filtered)} remaining")
+        log.info(
+            "  📅 Day filter: %d event(s) excluded, %d remaining",
+            excluded_count, len(filtered),
+        )
 
     return filtered
 
 
-def main() -> int:
-    """Main CLI entry point."""
+# Printed when no action flag is given (full help remains available via --help)
+_SHORT_USAGE = """\
+usage: calendar-sync [--source NAME ...] [--target NAME]
+                     (--list-calendars | --preview | --sync [--dry-run] | --clear-cache)
+                     [--lookback DAYS] [--lookahead DAYS]
+                     [--date YYYY-MM-DD | --start-date YYYY-MM-DD --end-date YYYY-MM-DD]
+                     [--verbose]
+
+No action specified. Run with --help for details."""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser."""
     parser = argparse.ArgumentParser(
         description="Calendar Sync - Synchronize calendars between Exchange EWS and M365"
     )
@@ -152,19 +333,19 @@ def main() -> int:
     )
     parser.add_argument(
         "--date",
-        type=str,
+        type=_iso_date,
         default=None,
         help="Sync only a specific date (YYYY-MM-DD format, e.g., 2026-02-04)",
     )
     parser.add_argument(
         "--start-date",
-        type=str,
+        type=_iso_date,
         default=None,
         help="Start date for sync range (YYYY-MM-DD format)",
     )
     parser.add_argument(
         "--end-date",
-        type=str,
+        type=_iso_date,
         default=None,
         help="End date for sync range (YYYY-MM-DD format)",
     )
@@ -174,9 +355,22 @@ def main() -> int:
         action="store_true",
         help="Verbose output",
     )
+    return parser
 
+
+def main() -> int:
+    """Main CLI entry point."""
+    parser = _build_parser()
     args = parser.parse_args()
 
+    if not (args.list_calendars or args.preview or args.sync or args.clear_cache):
+        print(_SHORT_USAGE)
+        return 0
+
+    # Deferred so that --help and argument errors don't pay for settings/MSAL imports
+    from .auth.token_cache import TokenCacheManager
+    from .config import config, sync_config
+
     # Setup logging
     log_level = "DEBUG" if args.verbose else config.log_level
     logger = setup_logging(level=log_level, log_file=config.log_file)
@@ -184,7 +378,7 @@ def main() -> int:
     try:
         # Initialize token cache
         cache_manager = TokenCacheManager(
-            cache_location=Path(config.token_cache_path),
+            cache_location=config.token_cache_path,
             encrypted=config.token_cache_encrypted,
         )
 
@@ -207,43 +401,53 @@ def main() -> int:
             return 1
 
         # Validate account names
-        for name in source_names:
-            if name not in sync_config.accounts:
-                logger.error(f"Unknown account: {name}")
-                return 1
+        accounts = sync_config.accounts
+        missing = [name for name in source_names if name not in accounts]
+        if missing:
+            logger.error("Unknown account(s): %s", ", ".join(missing))
+            return 1
+
+        # Resolve source accounts once for all branches below
+        sources = [(name, accounts[name]) for name in source_names]
+        skip_subjects = sync_config.skip_subjects
+
+        def _read_source(source: tuple) -> list:
+            """Read one source account and apply its filters, prefix and category."""
+            _, account = source
+            reader = _create_reader(account, cache_manager)
+            events = reader.iter_events(start_date=start, end_date=end)
+            return _process_events(events, account, skip_subjects)
+
+        def _read_sources(sources: list) -> list[list]:
+            """Read all sources concurrently, returning results in source order.
+
+            Each read is dominated by network round-trips (token acquisition,
+            Graph/EWS calls), so threads overlap the waits across accounts.
+            """
+            if len(sources) <= 1:
+                return [_read_source(src) for src in sources]
+            with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(sources))) as executor:
+                return list(executor.map(_read_source, sources))
 
         # Resolve sync window
         if args.date:
             # Single day mode
-            try:
-                import pytz
-                day = datetime.strptime(args.date, "%Y-%m-%d")
-                start = day.replace(hour=0, minute=0, second=0, tzinfo=pytz.utc)
-                end = day.replace(hour=23, minute=59, second=59, tzinfo=pytz.utc)
-                logger.info(f"Syncing single day: {args.date}")
-            except ValueError:
-                logger.error(f"Invalid date format: {args.date}. Use YYYY-MM-DD (e.g., 2026-02-04)")
-                return 1
+            start = args.date
+            end = start.replace(hour=23, minute=59, second=59)
+            logger.info("Syncing single day: %s", start.date())
         elif args.start_date or args.end_date:
             # Custom date range mode
-            import pytz
-            try:
-                if args.start_date:
-                    start = datetime.strptime(args.start_date, "%Y-%m-%d")
-                    start = start.replace(hour=0, minute=0, second=0, tzinfo=pytz.utc)
-                else:
-                    start = datetime.now(pytz.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            if args.start_date:
+                start = args.start_date
+            else:
+                start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
 
-                if args.end_date:
-                    end = datetime.strptime(args.end_date, "%Y-%m-%d")
-                    end = end.replace(hour=23, minute=59, second=59, tzinfo=pytz.utc)
-                else:
-                    end = start + timedelta(days=7)
+            if args.end_date:
+                end = args.end_date.replace(hour=23, minute=59, second=59)
+            else:
+                end = start + timedelta(days=7)
 
-                logger.info(f"Syncing date range: {start.date()} to {end.date()}")
-            except ValueError as e:
-                logger.error(f"Invalid date format. Use YYYY-MM-DD (e.g., 2026-02-04). Error: {e}")
-                return 1
+            logger.info("Syncing date range: %s to %s", start.date(), end.date())
         else:
             # Default: use lookback/lookahead
             lookback = args.lookback if args.lookback is not None else sync_config.lookback_days
@@ -252,8 +456,7 @@ def main() -> int:
 
         # List calendars
         if args.list_calendars:
-            for name in source_names:
-                account = sync_config.accounts[name]
+            for name, account in sources:
                 print(f"\n=== {name} ({account.type}) ===")
                 reader = _create_reader(account, cache_manager)
                 calendars = reader.list_calendars()
@@ -267,28 +470,8 @@ def main() -> int:
         # Preview events
         if args.preview:
             all_events = []
-            for name in source_names:
-                account = sync_config.accounts[name]
+            for (name, account), events in zip(sources, _read_sources(sources)):
                 print(f"\n=== {name} ({account.type}) ===")
-                reader = _create_reader(account, cache_manager)
-                events = reader.read_events(start_date=start, end_date=end)
-
-                # Apply skip_subjects filter
-                events = [
-                    e for e in events
-                    if e.subject.lower().strip() not in sync_config.skip_subjects
-                ]
-
-                # Apply day filtering (include_days / exclude_days)
-                events = _filter_events_by_day(events, account)
-
-                # Apply prefix and category
-                for e in events:
-                    if account.prefix and not e.subject.startswith(account.prefix):
-                        e.subject = f"{account.prefix} {e.subject}"
-                    if account.category and account.category not in e.categories:
-                        e.categories.append(account.category)
-
                 print(f"Found {len(events)} event(s):")
                 for event in events:
                     print(f"  - {event.subject}")
@@ -308,59 +491,31 @@ def main() -> int:
                 logger.error("No target account specified (set in sync_config.yaml or --target)")
                 return 1
             if target_name not in sync_config.accounts:
-                logger.error(f"Unknown target account: {target_name}")
+                logger.error("Unknown target account: %s", target_name)
                 return 1
 
             # Read from all sources
-            all_events = []
-            for name in source_names:
-                account = sync_config.accounts[name]
-                logger.info(f"Reading from {name} ({account.type})...")
-                reader = _create_reader(account, cache_manager)
-                events = reader.read_events(start_date=start, end_date=end)
-
-                # Apply skip_subjects filter
-                events = [
-                    e for e in events
-                    if e.subject.lower().strip() not in sync_config.skip_subjects
-                ]
+            for name, account in sources:
+                logger.info("Reading from %s (%s)...", name, account.type)
 
-                # Apply day filtering (include_days / exclude_days)
-                events = _filter_events_by_day(events, account)
-
-                # Apply prefix and category
-                for e in events:
-                    if account.prefix and not e.subject.startswith(account.prefix):
-                        e.subject = f"{account.prefix} {e.subject}"
-                    if account.category and account.category not in e.categories:
-                        e.categories.append(account.category)
-
-                all_events.extend(events)
-                logger.info(f"  {name}: {len(events)} events")
+            # Keep per-source lists; chain them instead of copying into one list
+            source_events = _read_sources(sources)
+            for (name, account), events in zip(sources, source_events):
+                logger.info("  %s: %d events", name, len(events))
+            total_events = sum(len(events) for events in source_events)
 
-            logger.info(f"Total events to sync: {len(all_events)}")
+            logger.info("Total events to sync: %d", total_events)
 
             # Create target writer
             target_account = sync_config.accounts[target_name]
-            if target_account.type.startswith("m365"):
-                from .writers.m365_writer import M365CalendarWriter
-
-                # Use model_construct to bypass environment variable loading
-                m365_cfg = M365Config.model_construct(
-                    tenant_id=target_account.tenant_id,
-                    client_id=target_account.client_id,
-                    client_secret=target_account.client_secret,
-                    primary_email=target_account.primary_email,
-                )
-                m365_auth = M365AuthProvider(m365_cfg, cache_manager)
-                target_writer = M365CalendarWriter(m365_auth, primary_email=target_account.primary_email)
-            else:
-                logger.error(f"Writing to {target_account.type} not supported")
+            try:
+                target_writer = _create_writer(target_account, cache_manager)
+            except ValueError as e:
+                logger.error(str(e))
                 return 1
 
             # Ensure categories exist with correct colors
-            for name in source_names:
-                account = sync_config.accounts[name]
+            for name, account in sources:
                 if account.category:
                     target_writer.ensure_category(account.category, account.color)
 
@@ -368,14 +523,14 @@ def main() -> int:
             existing = target_writer.get_existing_events(start, end)
 
             # Collect source event keys and prefixes for orphan detection
-            source_keys = set()
-            for event in all_events:
-                key = (event.subject, event.start.strftime("%Y-%m-%dT%H:%M"))
-                source_keys.add(key)
+            # Dedup keys are computed once per event and reused below
+            keyed_events = [
+                (event, _event_key(event)) for event in chain.from_iterable(source_events)
+            ]
+            source_keys = {key for _, key in keyed_events}
 
             source_prefixes = []
-            for name in source_names:
-                account = sync_config.accounts[name]
+            for name, account in sources:
                 if account.prefix:
                     source_prefixes.append(account.prefix)
 
@@ -386,27 +541,21 @@ def main() -> int:
                 if any(subject.startswith(p) for p in source_prefixes) and key not in source_keys:
                     orphans[key] = event_id
 
-            if args.dry_run:
-                skip_events = []
-                would_create = []
-                for event in all_events:
-                    key = (event.subject, event.start.strftime("%Y-%m-%dT%H:%M"))
-                    if key in existing:
-                        skip_events.append(event)
-                    else:
-                        would_create.append(event)
+            # Plan once: events to create vs. already present in the target
+            to_create, skip_events = _partition_new(keyed_events, existing)
 
+            if args.dry_run:
                 # Build unified row list: (sort_key, action, date, time, subject)
                 rows = []
-                for event in would_create:
-                    date_str = event.start.strftime("%Y-%m-%d")
-                    time_str = f"{event.start.strftime('%H:%M')} - {event.end.strftime('%H:%M')}"
-                    sort_key = event.start.strftime("%Y-%m-%dT%H:%M")
+                for event in to_create:
+                    sort_key = _event_key(event)[1]
+                    date_str = sort_key[:10]
+                    time_str = f"{sort_key[11:]} - {event.end.strftime('%H:%M')}"
                     rows.append((sort_key, "+", date_str, time_str, event.subject))
                 for key in orphans:
                     subject, start_str = key
                     try:
-                        dt = datetime.strptime(start_str, "%Y-%m-%dT%H:%M")
+                        dt = datetime.fromisoformat(start_str)
                         date_str = dt.strftime("%Y-%m-%d")
                         time_str = dt.strftime("%H:%M")
                         sort_key = start_str
@@ -416,9 +565,9 @@ def main() -> int:
                         sort_key = start_str
                     rows.append((sort_key, "-", date_str, time_str, subject))
                 for event in skip_events:
-                    date_str = event.start.strftime("%Y-%m-%d")
-                    time_str = f"{event.start.strftime('%H:%M')} - {event.end.strftime('%H:%M')}"
-                    sort_key = event.start.strftime("%Y-%m-%dT%H:%M")
+                    sort_key = _event_key(event)[1]
+                    date_str = sort_key[:10]
+                    time_str = f"{sort_key[11:]} - {event.end.strftime('%H:%M')}"
                     rows.append((sort_key, "=", date_str, time_str, event.subject))
 
                 rows.sort(key=lambda r: r[0])
@@ -436,7 +585,7 @@ def main() -> int:
                     return "  " + " | ".join(v.ljust(col_w[i]) for i, v in enumerate(vals))
 
                 print(f"\nDry run - {target_name} ({start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}):")
-                print(f"  Would create: {len(would_create)} | Would delete (orphan): {len(orphans)} | Already exist (skip): {len(skip_events)}")
+                print(f"  Would create: {len(to_create)} | Would delete (orphan): {len(orphans)} | Already exist (skip): {len(skip_events)}")
                 print()
                 print(fmt_row(headers))
                 print("  " + "-|-".join("-" * col_w[i] for i in range(4)))
@@ -446,35 +595,31 @@ def main() -> int:
 
             # Write events, skipping duplicates
             created = 0
-            skipped = 0
             deleted = 0
             errors = []
-            for event in all_events:
-                key = (event.subject, event.start.strftime("%Y-%m-%dT%H:%M"))
-                if key in existing:
-                    skipped += 1
-                    continue
-                try:
-                    target_writer.create_event(event)
-                    created += 1
-                except Exception as e:
-                    error_msg = f"Failed to sync '{event.subject}': {e}"
-                    logger.error(error_msg)
-                    errors.append(error_msg)
+            skipped = len(skip_events)
+
+            # Create new events in Graph $batch requests
+            created_events, failed = target_writer.create_events_batch(to_create)
+            created += len(created_events)
+            for event, err in failed:
+                error_msg = f"Failed to sync '{event.subject}': {err}"
+                logger.error(error_msg)
+                errors.append(error_msg)
 
             # Delete orphan events
             for key, event_id in orphans.items():
                 try:
                     target_writer.delete_event(event_id)
                     deleted += 1
-                    logger.info(f"Deleted orphan: {key[0]} ({key[1]})")
+                    logger.info("Deleted orphan: %s (%s)", key[0], key[1])
                 except Exception as e:
                     error_msg = f"Failed to delete orphan '{key[0]}': {e}"
                     logger.error(error_msg)
                     errors.append(error_msg)
 
             print(f"\nSync Results:")
-            print(f"  Events read: {len(all_events)}")
+            print(f"  Events read: {total_events}")
             print(f"  Events created: {created}")
             print(f"  Events deleted (orphan): {deleted}")
             print(f"  Events skipped (already exist): {skipped}")
@@ -485,15 +630,13 @@ def main() -> int:
                 return 1
             return 0
 
-        # No action specified
-        parser.print_help()
         return 0
 
     except CalendarSyncError as e:
-        logger.error(f"Calendar sync error: {e}")
+        logger.error("Calendar sync error: %s", e)
         return 1
     except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
+        logger.exception("Unexpected error: %s", e)
         return 1
 
 
@@ -5,6 +5,7 @@ from typing import Optional
 
 import msal
 from exchangelib import OAuth2Credentials
+from oauthlib.oauth2 import OAuth2Token
 
 from ..config import EWSConfig
 from ..utils.exceptions import AuthenticationError
@@ -64,6 +65,8 @@ class EWSAuthProvider(AuthProvider):
             token_cache=cache_manager.get_cache(),
         )
         self._credentials: Optional[OAuth2Credentials] = None
+        # Access token the cached credentials were built with
+        self._credentials_token: Optional[str] = None
 
     def acquire_token_silent(self) -> Optional[str]:
         """
@@ -140,6 +143,9 @@ class EWSAuthProvider(AuthProvider):
         """
         Get OAuth2Credentials for exchangelib.
 
+        The credentials object is reused until MSAL hands out a different
+        access token.
+
         Returns:
             OAuth2Credentials instance configured for EWS
 
@@ -147,12 +153,19 @@ class EWSAuthProvider(AuthProvider):
             AuthenticationError: If token acquisition fails
         """
         access_token = self.get_access_token()
-        return OAuth2Credentials(
+        if self._credentials is not None and self._credentials_token == access_token:
+            return self._credentials
+
+        self._credentials = OAuth2Credentials(
             client_id=self.config.client_id,
             client_secret=None,  # Not needed for public client flow
             tenant_id=self.config.tenant_id,
             identity=self.config.primary_email,
+            # exchangelib expects its own token type (oauthlib, via requests-oauthlib)
+            access_token=OAuth2Token({"access_token": access_token, "token_type": "Bearer"}),
         )
+        self._credentials_token = access_token
+        return self._credentials
 
     def clear_cache(self) -> None:
         """Clear cached tokens."""
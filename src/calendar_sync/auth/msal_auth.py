@@ -4,6 +4,7 @@ import logging
 from typing import Optional
 
 import msal
+import requests
 
 from ..config import M365Config
 from ..utils.exceptions import AuthenticationError
@@ -20,6 +21,7 @@ class M365AuthProvider(AuthProvider):
         self,
         config: M365Config,
         cache_manager: TokenCacheManager,
+        http_client: Optional[requests.Session] = None,
     ):
         """
         Initialize M365 authentication provider.
@@ -27,6 +29,7 @@ class M365AuthProvider(AuthProvider):
         Args:
             config: Microsoft 365 configuration
             cache_manager: Token cache manager
+            http_client: Optional session MSAL uses for its HTTP calls
 
         Raises:
             AuthenticationError: If required configuration is missing
@@ -43,6 +46,8 @@ class M365AuthProvider(AuthProvider):
         self.cache_manager = cache_manager
         self.client_secret = config.client_secret
         self.use_client_credentials = bool(config.client_id and config.client_secret)
+        # First cached MSAL account (delegated flow); None = not looked up, False = none found
+        self._cached_account = None
 
         if self.use_client_credentials:
             # Client credentials flow (app-only) - uses application permissions
@@ -53,6 +58,7 @@ class M365AuthProvider(AuthProvider):
                 client_credential=config.client_secret,
                 authority=authority,
                 token_cache=cache_manager.get_cache(),
+                http_client=http_client,
             )
         else:
             # Device code flow (delegated) - uses delegated permissions
@@ -66,6 +72,7 @@ class M365AuthProvider(AuthProvider):
                 client_id=client_id,
                 authority=authority,
                 token_cache=cache_manager.get_cache(),
+                http_client=http_client,
             )
 
     def acquire_token_silent(self) -> Optional[str]:
@@ -85,11 +92,13 @@ class M365AuthProvider(AuthProvider):
                 return result["access_token"]
         else:
             # Delegated flow - check for user accounts
-            accounts = self.app.get_accounts()
-            if accounts:
+            if self._cached_account is None:
+                accounts = self.app.get_accounts()
+                self._cached_account = accounts[0] if accounts else False
+            if self._cached_account:
                 result = self.app.acquire_token_silent(
                     scopes=self.scopes,
-                    account=accounts[0],
+                    account=self._cached_account,
                 )
                 if result and "access_token" in result:
                     logger.debug("Token acquired from cache (delegated)")
@@ -154,6 +163,8 @@ class M365AuthProvider(AuthProvider):
         result = self.app.acquire_token_by_device_flow(flow)
 
         if "access_token" in result:
+            # The cache now holds the signed-in account; look it up again next time
+            self._cached_account = None
             logger.info("Token acquired via device code flow")
             print("✓ Authentication successful!\n")
             return result["access_token"]
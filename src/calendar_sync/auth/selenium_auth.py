@@ -1,19 +1,440 @@
 """Selenium-based authentication for Exchange behind F5/SAML/OIDC."""
 
-import json
+import atexit
+import hashlib
 import logging
+import os
+import re
+import shutil
+import tempfile
+import threading
 import time
 from pathlib import Path
-from typing import Optional
-
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.support.ui import WebDriverWait
+from typing import TYPE_CHECKING, ClassVar, Optional
 
+from ..utils import json_utils
 from ..utils.exceptions import AuthenticationError
+from ..utils.http import create_session
+
+if TYPE_CHECKING:
+    import requests
+    from selenium import webdriver
 
 logger = logging.getLogger(__name__)
 
+# Browser User-Agent sent with direct HTTP calls so they look like the login browser
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
+
+# Chromium switches/prefs that skip resources irrelevant to the SSO login flow
+LIGHTWEIGHT_BROWSER_ARGS = (
+    "--blink-settings=imagesEnabled=false",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-features=TranslateUI,MediaRouter",
+    "--disable-gpu",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--disable-popup-blocking",
+)
+LIGHTWEIGHT_BROWSER_PREFS = {
+    "profile.managed_default_content_settings.images": 2,
+    "profile.default_content_setting_values.notifications": 2,
+    "autofill.profile_enabled": False,
+}
+
+# Idle browsers kept for reuse; the least recently released one is quit first
+MAX_POOLED_DRIVERS = 4
+
+
+# Looks for the OWA canary in every in-page location known to hold it and
+# returns the first hit (or null) so the lookup costs one driver round trip
+COMBINED_CANARY_JS = r"""
+    try {
+        if (window.g_CanaryValue) return window.g_CanaryValue;
+        if (window.odataCanary) return window.odataCanary;
+        if (window.__owa_boot && window.__owa_boot.canary) return window.__owa_boot.canary;
+        if (typeof Boot !== 'undefined' && Boot.canary) return Boot.canary;
+        var state = window.__PRELOADED_STATE__;
+        if (state && state.session && state.session.canary) return state.session.canary;
+    } catch (e) {}
+
+    try {
+        var stored = window.localStorage.getItem('x-owa-canary') ||
+            window.localStorage.getItem('X-OWA-CANARY');
+        if (stored) return stored;
+        for (var i = 0; i < sessionStorage.length; i++) {
+            var key = sessionStorage.key(i);
+            if (key.toLowerCase().includes('canary')) return sessionStorage.getItem(key);
+        }
+    } catch (e) {}
+
+    try {
+        if (window.O365Shell && window.O365Shell.FlexPane) {
+            var data = window.O365Shell.FlexPane.HeaderButton;
+            if (data && data.canary) return data.canary;
+        }
+    } catch (e) {}
+
+    var patterns = [
+        /"canary"\s*:\s*"([^"]+)"/,
+        /CanaryValue\s*=\s*"([^"]+)"/,
+        /x-owa-canary['"\s:]+['"]([^'"]+)['"]/i
+    ];
+    var scripts = document.getElementsByTagName('script');
+    for (var j = 0; j < scripts.length; j++) {
+        var content = scripts[j].textContent || scripts[j].innerHTML;
+        if (!content) continue;
+        for (var k = 0; k < patterns.length; k++) {
+            var match = content.match(patterns[k]);
+            if (match) return match[1];
+        }
+    }
+    return null;
+"""
+
+# Installs window.__extractEvents(), which returns the distinct aria-labels of
+# the event cards in the OWA view on screen; the labels are parsed in Python
+# by _parse_event_label()
+EXTRACT_EVENTS_INSTALL_JS = r"""
+    const SELECTORS = [
+        '[role="button"][aria-label*="event"]',
+        '[role="button"][aria-label*=", "][aria-label*=" to "]',
+        '[data-automation-id="CalendarEventCard"]',
+        '.ms-CalendarEvent'
+    ];
+
+    window.__extractEvents = function() {
+        const labels = new Set();
+        try {
+            for (const selector of SELECTORS) {
+                for (const el of document.querySelectorAll(selector)) {
+                    const label = el.getAttribute('aria-label');
+                    if (label && label.length > 10 && label.includes(' to ')) {
+                        labels.add(label);
+                    }
+                }
+            }
+        } catch(e) {
+            console.error('DOM extraction error:', e);
+        }
+        return [...labels];
+    };
+"""
+
+# Pieces of an OWA event card aria-label, e.g. "Standup, 9:30 AM to 10:00 AM,
+# Monday, October 19, 2026, By Jane Doe, Recurring event"
+DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+MONTH_NAMES = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+_MONTH_NUMBERS = {name.lower(): i for i, name in enumerate(MONTH_NAMES, start=1)}
+_YEAR_RE = re.compile(r"\d{4}")
+_TIME_12H_RE = re.compile(
+    r"(\d{1,2}:\d{2})\s*(AM|PM)?\s+to\s+(\d{1,2}:\d{2})\s*(AM|PM)?", re.IGNORECASE
+)
+_TIME_24H_RE = re.compile(r"(\d{1,2}:\d{2})\s+to\s+(\d{1,2}:\d{2})")
+_MONTH_DAY_RE = re.compile(r"([A-Za-z]+)\s+(\d+)")
+
+# Calls the installed extractor; null means this page doesn't have it yet
+EXTRACT_EVENTS_CALL_JS = (
+    "return typeof window.__extractEvents === 'function' ? window.__extractEvents() : null;"
+)
+
+# Event fields requested from the Outlook REST API v2.0 calendarview
+REST_EVENT_FIELDS = (
+    "Id,Subject,Start,End,Location,Organizer,Attendees,IsAllDay,IsCancelled,"
+    "ShowAs,Body,Categories,Recurrence"
+)
+
+# How long a found X-OWA-CANARY is reused before searching the page again
+CANARY_TTL = 3600.0
+
+# Same-origin probe of the OWA session. Returns the HTTP status, 'redirect'
+# for a redirect (to login; opaque under redirect: 'manual') or 'error'
+OWA_PROBE_JS = """
+    return fetch('/owa/', {credentials: 'include', method: 'HEAD', redirect: 'manual'})
+        .then(r => r.type === 'opaqueredirect' ? 'redirect' : r.status)
+        .catch(() => 'error');
+"""
+# How long a successful probe is trusted before probing again
+OWA_PROBE_TTL = 300.0
+
+# Page title words that show OWA has finished loading after the SSO redirect
+OWA_TITLE_KEYWORDS = ("outlook", "inbox", "mail", "calendar", "owa")
+_OWA_TITLE_RE = re.compile("|".join(OWA_TITLE_KEYWORDS), re.IGNORECASE)
+
+# OWA week view: event cards and the "Go to next week" button
+EVENT_CARD_SELECTOR = (
+    '[role="button"][aria-label*="event"], [data-automation-id="CalendarEventCard"]'
+)
+NEXT_WEEK_BUTTON_SELECTOR = 'button[aria-label*="next week" i]'
+# Week views loaded side by side in tabs during DOM extraction
+MAX_WEEK_TABS = 4
+
+
+def _add_lightweight_options(options) -> None:
+    """Apply LIGHTWEIGHT_BROWSER_ARGS/PREFS to Chrome or Edge options."""
+    for arg in LIGHTWEIGHT_BROWSER_ARGS:
+        options.add_argument(arg)
+    options.add_experimental_option("prefs", dict(LIGHTWEIGHT_BROWSER_PREFS))
+
+
+def _wait_ready(driver, timeout: float = 10.0) -> bool:
+    """
+    Wait until the current document has finished loading.
+
+    Args:
+        driver: WebDriver instance
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the page reported readyState "complete" in time, False otherwise
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
+        return True
+    except TimeoutException:
+        return False
+
+
+def _wait_for_cookie(driver, name: str, timeout: float = 5.0) -> Optional[dict]:
+    """
+    Wait for a cookie to be set on the current site.
+
+    Args:
+        driver: WebDriver instance
+        name: Cookie name
+        timeout: Maximum seconds to wait
+
+    Returns:
+        The cookie dict, or None if it did not appear in time
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        return WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.get_cookie(name)
+        )
+    except TimeoutException:
+        return None
+
+
+def _wait_week_rendered(driver, timeout: float = 20.0) -> bool:
+    """
+    Wait for the OWA week view to render.
+
+    The view counts as rendered once an event card or, for an empty week, the
+    week navigation button is present.
+
+    Args:
+        driver: WebDriver instance on the OWA week view
+        timeout: Maximum seconds to wait
+
+    Returns:
+        True if the view rendered in time, False otherwise
+    """
+    from selenium.common.exceptions import TimeoutException
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+            EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, EVENT_CARD_SELECTOR)),
+                EC.presence_of_element_located((By.CSS_SELECTOR, NEXT_WEEK_BUTTON_SELECTOR)),
+            )
+        )
+        return True
+    except TimeoutException:
+        logger.debug("Week view did not render any known element in time")
+        return False
+
+
+def _to_24h(time_str: str, period: str) -> str:
+    """Convert an "h:mm" time with an AM/PM marker to "HH:MM"."""
+    hour, minute = (int(x) for x in time_str.split(":"))
+    period = period.upper()
+    if period == "PM" and hour < 12:
+        hour += 12
+    elif period == "AM" and hour == 12:
+        hour = 0
+    return f"{hour:02d}:{minute:02d}"
+
+
+def _parse_event_label(label: str) -> Optional[dict]:
+    """
+    Parse an OWA event card aria-label into an event dictionary.
+
+    Args:
+        label: aria-label text of the event card
+
+    Returns:
+        Event in the REST API's shape (Subject/Start/End/Organizer), or None
+        if the label has too few parts to be an event
+    """
+    parts = label.split(", ")
+    if len(parts) < 4:
+        return None
+
+    subject, time_range = parts[0], parts[1]
+    month_day = year = organizer = ""
+    for part in parts[2:]:
+        part = part.strip()
+        if part.startswith(DAY_NAMES):
+            continue
+        if part.startswith(MONTH_NAMES):
+            month_day = part
+        elif _YEAR_RE.fullmatch(part):
+            year = part
+        elif part.startswith("By "):
+            organizer = part[3:]
+
+    start_time = end_time = ""
+    # Without any AM/PM marker the label uses a 24-hour clock
+    match = _TIME_12H_RE.search(time_range)
+    if match and (match.group(2) or match.group(4)):
+        start_period = match.group(2) or match.group(4)
+        end_period = match.group(4) or start_period
+        start_time = _to_24h(match.group(1), start_period)
+        end_time = _to_24h(match.group(3), end_period)
+    else:
+        match = _TIME_24H_RE.search(time_range)
+        if match:
+            start_time = match.group(1).zfill(5)
+            end_time = match.group(2).zfill(5)
+
+    start = end = None
+    if month_day and year:
+        match = _MONTH_DAY_RE.search(month_day)
+        month = _MONTH_NUMBERS.get(match.group(1).lower()) if match else None
+        day = int(match.group(2)) if match else 0
+        if month and day > 0:
+            date_prefix = f"{year}-{month:02d}-{day:02d}"
+            start = {"DateTime": f"{date_prefix}T{start_time or '00:00'}:00", "TimeZone": "UTC"}
+            end = {"DateTime": f"{date_prefix}T{end_time or '23:59'}:00", "TimeZone": "UTC"}
+
+    return {
+        "Subject": subject,
+        "Start": start,
+        "End": end,
+        "Organizer": {"EmailAddress": {"Name": organizer}} if organizer else None,
+        "IsRecurring": "Recurring event" in label,
+        "_rawLabel": label,
+        "_source": "dom",
+    }
+
+
+def _extract_week_events(driver) -> Optional[list[str]]:
+    """
+    Extract the event labels of the OWA view on screen.
+
+    The extractor is installed on the page the first time and afterwards
+    invoked by name, so the full script is only sent once per document.
+
+    Args:
+        driver: WebDriver instance on an OWA calendar view
+
+    Returns:
+        List of aria-label strings
+    """
+    result = driver.execute_script(EXTRACT_EVENTS_CALL_JS)
+    if result is None:
+        result = driver.execute_script(
+            EXTRACT_EVENTS_INSTALL_JS + "\nreturn window.__extractEvents();"
+        )
+    return result
+
+
+def _canary_from_network_log(driver) -> Optional[str]:
+    """
+    Find the X-OWA-CANARY response header in the browser's performance log.
+
+    Reading the log drains it, so each call only sees events recorded since
+    the previous one.
+
+    Args:
+        driver: WebDriver instance launched with performance logging enabled
+
+    Returns:
+        Most recent canary value, or None if no response carried one
+    """
+    try:
+        entries = driver.get_log("performance")
+    except Exception as e:
+        logger.debug("Performance log not available: %s", e)
+        return None
+
+    for entry in reversed(entries):
+        raw = entry.get("message", "")
+        # Cheap substring filter before decoding the event JSON
+        if "x-owa-canary" not in raw.lower():
+            continue
+        try:
+            message = json_utils.loads(raw)["message"]
+        except (ValueError, KeyError, TypeError):
+            continue
+        if message.get("method") not in (
+            "Network.responseReceived",
+            "Network.responseReceivedExtraInfo",
+        ):
+            continue
+        params = message.get("params", {})
+        headers = params.get("response", {}).get("headers") or params.get("headers") or {}
+        for name, value in headers.items():
+            if name.lower() == "x-owa-canary" and value:
+                return value
+    return None
+
+
+def _cookie_matches_host(domain: str, host: str) -> bool:
+    """
+    Check whether a cookie's domain covers a host.
+
+    Args:
+        domain: Cookie domain, with or without the leading dot
+        host: Host name, optionally with a port
+
+    Returns:
+        True if the cookie would be sent to the host
+    """
+    domain = domain.lstrip(".").lower()
+    host = host.split(":", 1)[0].lower()
+    return bool(domain) and (host == domain or host.endswith("." + domain))
+
+
+def _drain_performance_log(driver) -> None:
+    """Discard buffered performance log entries, if the driver records any."""
+    try:
+        driver.get_log("performance")
+    except Exception:
+        pass
+
+
+def _driver_alive(driver) -> bool:
+    """Check that a driver's browser still answers WebDriver commands."""
+    try:
+        driver.current_url
+        return True
+    except Exception:
+        return False
+
+
+def _quit_quietly(driver) -> None:
+    """Quit a driver, ignoring errors from a browser that is already gone."""
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
 
 class SeleniumEWSAuth:
     """
@@ -23,6 +444,19 @@ class SeleniumEWSAuth:
     OIDC/SAML authentication that requires browser interaction.
     """
 
+    # Idle browsers shared across instances, keyed by (browser, headless, profile)
+    # and ordered from least to most recently released
+    _driver_pool: ClassVar[dict[tuple, "webdriver.Chrome"]] = {}
+    _driver_pool_lock: ClassVar[threading.Lock] = threading.Lock()
+    # Browsers handed out and not yet released (including kept ones), by pool
+    # key; None while one is being launched. Each holds its profile's lock.
+    _active_drivers: ClassVar[dict[tuple, Optional["webdriver.Chrome"]]] = {}
+    # Browsers on throwaway profiles, by id(driver): (driver, profile dir)
+    _temp_drivers: ClassVar[dict[int, tuple["webdriver.Chrome", Path]]] = {}
+    # Keep-alive session for cookie validation, shared across instances
+    _session: ClassVar[Optional["requests.Session"]] = None
+    _session_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         base_url: str,
@@ -31,6 +465,7 @@ class SeleniumEWSAuth:
         browser: str = "chrome",
         use_browser_api: bool = False,
         headless: bool = False,
+        login_timeout: float = 300.0,
     ):
         """
         Initialize Selenium-based EWS authentication.
@@ -42,15 +477,321 @@ class SeleniumEWSAuth:
             browser: Browser to use ('chrome' or 'edge')
             use_browser_api: If True, keep browser open for API calls instead of using cookies
             headless: If True, run browser in headless mode (no visible UI)
+            login_timeout: Seconds to wait for the user to finish logging in
         """
         self.base_url = base_url.rstrip("/")
+        # Host part of base_url; works for both Office 365 (outlook.office.com)
+        # and on-premise servers (e.g., mail.ext.icrc.org)
+        self._base_domain = self.base_url.split("://", 1)[-1].split("/", 1)[0]
         self.cookie_file = cookie_file
+        # Persistent browser profile (SSO session, HTTP cache) kept next to the cookie file
+        self._profile_dir = cookie_file.parent / f"{cookie_file.stem}.{browser.lower()}-profile"
         self.required_cookies = required_cookies or ["MRHSession"]
+        # Set form for O(1) membership checks; the list keeps display order
+        self._required_set = frozenset(self.required_cookies)
         self.browser = browser.lower()
         self.use_browser_api = use_browser_api
         self.headless = headless
+        self.login_timeout = login_timeout
         self._cookies: Optional[dict[str, str]] = None
-        self._driver: Optional[webdriver.Chrome] = None  # Keep browser instance
+        # Cookie file mtime (ns) that self._cookies was read from or written as
+        self._cookies_mtime: Optional[int] = None
+        self._driver: Optional["webdriver.Chrome"] = None  # Keep browser instance
+        self._driver_profile: Optional[Path] = None  # Profile self._driver was built with
+        # Successful validate_cookies() results: cookie digest -> monotonic time
+        self._validation_cache: dict[str, float] = {}
+        self._validation_ttl: float = 300.0
+        # Last X-OWA-CANARY accepted by OWA and when (time.time()) it was found
+        self._cached_canary: Optional[str] = None
+        self._cached_canary_time: float = 0.0
+        # Whether the browser's OWA session was last seen working, and when
+        # (time.monotonic())
+        self._owa_reachable: Optional[bool] = None
+        self._owa_reachable_time: float = 0.0
+
+    def _browser_profile_dir(self) -> Path:
+        """
+        Get the persistent browser profile directory for this account.
+
+        The profile keeps the identity provider's SSO session between runs so a
+        cookie refresh can often complete without a full re-login. It holds
+        session tokens, so access is restricted to the current user.
+
+        Returns:
+            Path to the profile directory (created if missing)
+        """
+        profile_dir = self._profile_dir
+        profile_dir.mkdir(parents=True, exist_ok=True)
+        try:
+            profile_dir.chmod(0o700)
+        except OSError as e:
+            logger.debug("Could not restrict permissions on %s: %s", profile_dir, e)
+        return profile_dir
+
+    def _build_options(self, capture_network: bool = False):
+        """
+        Build the Chrome or Edge options shared by every browser launch.
+
+        Args:
+            capture_network: Record network events in the performance log so
+                response headers (X-OWA-CANARY) can be read back; only the
+                login launch needs this
+
+        Returns:
+            Configured options for self.browser
+
+        Raises:
+            AuthenticationError: If Edge support is not available
+        """
+        if self.browser == "edge":
+            try:
+                from selenium.webdriver.edge.options import Options
+            except ImportError:
+                raise AuthenticationError(
+                    "Edge WebDriver not available. Install with: pip install selenium[edge]"
+                )
+        else:
+            from selenium.webdriver.chrome.options import Options
+
+        options = Options()
+        # Return from driver.get() at DOMContentLoaded; the flow polls for the
+        # URL/cookie/title state it needs (or _wait_ready) rather than onload
+        options.page_load_strategy = "eager"
+        options.add_experimental_option("detach", False)
+        options.add_experimental_option("excludeSwitches", ["enable-automation"])
+        options.add_experimental_option("useAutomationExtension", False)
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        _add_lightweight_options(options)
+        if capture_network:
+            # "goog:" for Chrome, "ms:" for Edge
+            vendor = options.KEY.split(":", 1)[0]
+            options.set_capability(f"{vendor}:loggingPrefs", {"performance": "ALL"})
+        self._add_profile_options(options)
+        if self.headless:
+            options.add_argument("--headless=new")
+            options.add_argument("--window-size=1920,1080")
+        return options
+
+    def _add_profile_options(self, options) -> Path:
+        """
+        Point Chrome or Edge options at this account's persistent profile.
+
+        Args:
+            options: Chrome or Edge options to update
+
+        Returns:
+            Path to the profile directory
+        """
+        profile_dir = self._browser_profile_dir()
+        options.add_argument(f"--user-data-dir={profile_dir}")
+        options.add_argument("--profile-directory=Default")
+        return profile_dir
+
+    def _pool_key(self, profile_dir: Optional[Path]) -> tuple:
+        """Build the driver pool key for this account's browser settings."""
+        return (self.browser, self.headless, str(profile_dir) if profile_dir else None)
+
+    def _build_driver(self, options, profile_dir: Optional[Path] = None) -> "webdriver.Chrome":
+        """
+        Get a browser driver, reusing a live one for the same profile if possible.
+
+        This instance's kept browser is handed over first, then an idle pooled
+        one; only if neither is alive is a new browser launched. If the
+        profile is held by another live browser, the new one gets a temporary
+        profile instead of failing on the profile lock.
+
+        Args:
+            options: Chrome or Edge options used if a new browser must be launched
+            profile_dir: User data directory the options point at, if any
+
+        Returns:
+            WebDriver instance
+        """
+        from selenium.common.exceptions import SessionNotCreatedException
+
+        key = self._pool_key(profile_dir)
+
+        if self._driver is not None and self._driver_profile == profile_dir:
+            driver = self._driver
+            self._driver = None
+            self._driver_profile = None
+            if _driver_alive(driver):
+                logger.debug("Reusing kept %s browser", self.browser)
+                return driver
+            self._discard_driver(driver, profile_dir)
+
+        with self._driver_pool_lock:
+            driver = self._driver_pool.pop(key, None)
+        if driver is not None:
+            if _driver_alive(driver):
+                logger.debug("Reusing pooled %s browser", self.browser)
+                with self._driver_pool_lock:
+                    self._active_drivers[key] = driver
+                return driver
+            _quit_quietly(driver)
+
+        if profile_dir is None:
+            return self._launch_driver(options)
+
+        # Claim the profile before launching so a concurrent re-auth on the
+        # same account can't start a second browser on it
+        with self._driver_pool_lock:
+            busy = key in self._active_drivers
+            if not busy:
+                self._active_drivers[key] = None
+        if busy:
+            logger.info("Browser profile %s is in use, using a temporary profile", profile_dir)
+            return self._launch_temp_profile_driver(options)
+
+        try:
+            driver = self._launch_driver(options)
+        except SessionNotCreatedException as e:
+            with self._driver_pool_lock:
+                self._active_drivers.pop(key, None)
+            # Typically the profile is locked by a browser outside this process
+            logger.warning(
+                "Could not start %s on profile %s, using a temporary profile: %s",
+                self.browser,
+                profile_dir,
+                e.msg,
+            )
+            return self._launch_temp_profile_driver(options)
+        except BaseException:
+            with self._driver_pool_lock:
+                self._active_drivers.pop(key, None)
+            raise
+        with self._driver_pool_lock:
+            self._active_drivers[key] = driver
+        return driver
+
+    def _launch_driver(self, options) -> "webdriver.Chrome":
+        """Launch a new Chrome or Edge browser with the given options."""
+        from selenium import webdriver
+
+        # Keep-alive makes the many small WebDriver commands share one TCP
+        # connection to the local driver instead of reconnecting per command
+        if self.browser == "edge":
+            return webdriver.Edge(options=options, keep_alive=True)
+        return webdriver.Chrome(options=options, keep_alive=True)
+
+    def _launch_temp_profile_driver(self, options) -> "webdriver.Chrome":
+        """
+        Launch a browser on a throwaway profile instead of the persistent one.
+
+        The profile is deleted when the driver is discarded or at shutdown; such
+        drivers are never pooled.
+
+        Args:
+            options: Chrome or Edge options pointing at the persistent profile
+
+        Returns:
+            WebDriver instance
+        """
+        temp_dir = Path(tempfile.mkdtemp(prefix=f"calendar-sync-{self.browser}-"))
+        options.arguments[:] = [
+            arg
+            for arg in options.arguments
+            if not arg.startswith(("--user-data-dir=", "--profile-directory="))
+        ]
+        options.add_argument(f"--user-data-dir={temp_dir}")
+        try:
+            driver = self._launch_driver(options)
+        except BaseException:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+        with self._driver_pool_lock:
+            self._temp_drivers[id(driver)] = (driver, temp_dir)
+        return driver
+
+    def _release_driver(self, driver, profile_dir: Optional[Path] = None) -> None:
+        """
+        Return a driver to the pool instead of quitting it.
+
+        Cookies for the current site are cleared so the next user starts from
+        the cookie file rather than a leftover session. If another idle driver
+        already holds the slot, this one is shut down; if the pool is over
+        MAX_POOLED_DRIVERS, the least recently released driver is.
+
+        Args:
+            driver: WebDriver instance to release
+            profile_dir: User data directory the driver was built with, if any
+        """
+        with self._driver_pool_lock:
+            temporary = id(driver) in self._temp_drivers
+        if temporary:
+            self._discard_driver(driver, profile_dir)
+            return
+
+        key = self._pool_key(profile_dir)
+        try:
+            driver.delete_all_cookies()
+            driver.get("about:blank")
+            _drain_performance_log(driver)
+        except Exception:
+            # Browser is already gone or wedged; don't pool it
+            self._discard_driver(driver, profile_dir)
+            return
+        evicted = []
+        with self._driver_pool_lock:
+            if self._active_drivers.get(key) is driver:
+                del self._active_drivers[key]
+            if key in self._driver_pool:
+                evicted.append(driver)
+            else:
+                self._driver_pool[key] = driver
+                while len(self._driver_pool) > MAX_POOLED_DRIVERS:
+                    oldest = next(iter(self._driver_pool))
+                    evicted.append(self._driver_pool.pop(oldest))
+        for stale in evicted:
+            _quit_quietly(stale)
+
+    def _discard_driver(self, driver, profile_dir: Optional[Path] = None) -> None:
+        """
+        Quit a driver for good instead of pooling it.
+
+        Args:
+            driver: WebDriver instance to quit
+            profile_dir: User data directory the driver was built with, if any
+        """
+        _quit_quietly(driver)
+        key = self._pool_key(profile_dir)
+        with self._driver_pool_lock:
+            temp = self._temp_drivers.pop(id(driver), None)
+            if self._active_drivers.get(key) is driver:
+                del self._active_drivers[key]
+        if temp is not None:
+            shutil.rmtree(temp[1], ignore_errors=True)
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """
+        Quit every browser this process started, idle or in use.
+
+        Registered to run at interpreter exit, so browsers kept for API calls
+        don't outlive the run.
+        """
+        with cls._driver_pool_lock:
+            drivers = list(cls._driver_pool.values()) + [
+                d for d in cls._active_drivers.values() if d is not None
+            ]
+            temps = list(cls._temp_drivers.values())
+            cls._driver_pool.clear()
+            cls._active_drivers.clear()
+            cls._temp_drivers.clear()
+        for driver in drivers:
+            _quit_quietly(driver)
+        for driver, temp_dir in temps:
+            _quit_quietly(driver)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+    def _cookie_file_mtime(self) -> Optional[int]:
+        """Get the cookie file's modification time in ns, or None if it is missing."""
+        try:
+            return self.cookie_file.stat().st_mtime_ns
+        except OSError:
+            return None
 
     def load_cookies(self) -> Optional[dict[str, str]]:
         """
@@ -59,28 +800,35 @@ class SeleniumEWSAuth:
         Returns:
             Dictionary of cookies if file exists and valid, None otherwise
         """
-        if not self.cookie_file.exists():
-            logger.info(f"Cookie file not found: {self.cookie_file}")
+        mtime = self._cookie_file_mtime()
+        if mtime is None:
+            logger.info("Cookie file not found: %s", self.cookie_file)
             return None
+        # File unchanged since we last read or wrote it
+        if self._cookies is not None and mtime == self._cookies_mtime:
+            return self._cookies
 
         try:
-            with open(self.cookie_file, "r") as f:
-                data = json.load(f)
-
-            # Validate that required cookies are present
-            if isinstance(data, dict):
-                missing = [c for c in self.required_cookies if c not in data]
-                if missing:
-                    logger.warning(f"Missing required cookies: {missing}")
-                    return None
+            data = json_utils.loads(self.cookie_file.read_bytes())
+        except (OSError, ValueError) as e:
+            # ValueError covers malformed JSON and non-UTF-8 content
+            logger.warning("Failed to load cookies: %s", e)
+            return None
 
-                logger.info(f"Loaded {len(data)} cookies from {self.cookie_file}")
-                return data
+        if not isinstance(data, dict):
+            logger.warning("Cookie file root is %s, not dict", type(data).__name__)
+            return None
 
-        except Exception as e:
-            logger.warning(f"Failed to load cookies: {e}")
+        # Validate that required cookies are present
+        missing = self._required_set - data.keys()
+        if missing:
+            logger.warning("Missing required cookies: %s", sorted(missing))
+            return None
 
-        return None
+        logger.info("Loaded %d cookies from %s", len(data), self.cookie_file)
+        self._cookies = data
+        self._cookies_mtime = mtime
+        return data
 
     def save_cookies(self, cookies: dict[str, str]) -> None:
         """
@@ -93,20 +841,36 @@ class SeleniumEWSAuth:
             # Create parent directory if it doesn't exist
             self.cookie_file.parent.mkdir(parents=True, exist_ok=True)
 
-            with open(self.cookie_file, "w") as f:
-                json.dump(cookies, f, indent=2)
+            # Write to a sibling temp file and swap it in so a crash mid-write
+            # never leaves a truncated cookie file behind
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cookie_file.parent, prefix=".cookies.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(json_utils.dumps(cookies))
+                os.replace(tmp_path, self.cookie_file)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
 
-            logger.info(f"✅ Saved {len(cookies)} cookies to {self.cookie_file}")
+            self._cookies = cookies
+            self._cookies_mtime = self._cookie_file_mtime()
+            logger.info("✅ Saved %d cookies to %s", len(cookies), self.cookie_file)
 
         except Exception as e:
-            logger.error(f"Failed to save cookies: {e}")
+            logger.error("Failed to save cookies: %s", e)
             raise AuthenticationError(f"Failed to save cookies: {e}") from e
 
     def delete_cookie_cache(self) -> None:
         """Delete the cached cookie file so the next call fetches fresh cookies."""
-        if self.cookie_file.exists():
+        self._cookies = None
+        self._validation_cache.clear()
+        try:
             self.cookie_file.unlink()
-            logger.info(f"Deleted cookie cache: {self.cookie_file}")
+        except FileNotFoundError:
+            return
+        logger.info("Deleted cookie cache: %s", self.cookie_file)
 
     def fetch_cookies_from_browser(self) -> dict[str, str]:
         """
@@ -118,49 +882,27 @@ class SeleniumEWSAuth:
         Raises:
             AuthenticationError: If browser automation fails or cookies not found
         """
+        # Selenium is only imported when a browser is actually needed
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        self._validation_cache.clear()
         browser_name = self.browser.capitalize()
         headless_msg = " (headless)" if self.headless else ""
-        print(f"🌐 Opening {browser_name}{headless_msg} to let you log in...")
+        logger.info("🌐 Opening %s%s to let you log in...", browser_name, headless_msg)
 
-        # Create browser-specific options and driver
-        if self.browser == "edge":
-            try:
-                from selenium.webdriver.edge.options import Options
-                options = Options()
-                options.add_experimental_option("detach", False)
-                options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                options.add_experimental_option("useAutomationExtension", False)
-                options.add_argument("--disable-blink-features=AutomationControlled")
-                options.add_argument("--no-sandbox")
-                options.add_argument("--disable-dev-shm-usage")
-                if self.headless:
-                    options.add_argument("--headless=new")
-                    options.add_argument("--window-size=1920,1080")
-                driver = webdriver.Edge(options=options)
-            except ImportError:
-                raise AuthenticationError(
-                    "Edge WebDriver not available. Install with: pip install selenium[edge]"
-                )
-        else:  # chrome
-            options = ChromeOptions()
-            options.add_experimental_option("detach", False)
-            options.add_experimental_option("excludeSwitches", ["enable-automation"])
-            options.add_experimental_option("useAutomationExtension", False)
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--remote-debugging-port=9222")
-            if self.headless:
-                options.add_argument("--headless=new")
-                options.add_argument("--window-size=1920,1080")
-            driver = webdriver.Chrome(options=options)
+        options = self._build_options(capture_network=True)
+        profile_dir = self._profile_dir
+        driver = self._build_driver(options, profile_dir)
         # options = Options()
         # options.add_experimental_option("detach", False)
         # driver = webdriver.Chrome(options=options)
         # # driver.get(BASE_URL)
+        keep_driver = False
+        succeeded = False
         try:
             login_url = f"{self.base_url}/owa/?path=/calendar"
-            print(f"🔗 Navigating to {login_url}...")
+            logger.info("🔗 Navigating to %s...", login_url)
             driver.get(login_url)
 
             # Wait for the page to actually load
@@ -168,7 +910,7 @@ class SeleniumEWSAuth:
                 lambda d: d.current_url != "data:," and d.current_url != "about:blank"
             )
 
-            print(f"✅ Loaded: {driver.current_url}")
+            logger.info("✅ Loaded: %s", driver.current_url)
             print()
             print("=" * 70)
             print("🔐 PLEASE COMPLETE AUTHENTICATION")
@@ -182,312 +924,411 @@ class SeleniumEWSAuth:
             print("=" * 70)
             print()
 
-            # Wait for all required cookies to appear AND for OWA to fully load
-            cookies_found = {}
-            owa_fully_loaded = False
-            max_wait = 300  # 5 minutes timeout
-            start_time = time.time()
-            initial_wait_done = False
-
             print("⏳ Waiting for you to complete login and MFA...")
             print("   (Browser will close automatically once you reach your inbox)")
             print()
 
-            while not owa_fully_loaded:
-                if time.time() - start_time > max_wait:
-                    raise AuthenticationError(
-                        f"Timeout waiting for authentication. OWA loaded: {owa_fully_loaded}, URL: {driver.current_url[:50]}"
-                    )
-
-                current_url = driver.current_url
+            # Wait for all required cookies to appear AND for OWA to fully load.
+            # Last cookie list seen by the wait predicate, reused after the wait
+            captured: dict[str, list] = {}
+            seen_names: set[str] = set()
+            cookies_ok = False
 
-                # FIRST: Wait until we're completely off the login page
+            def ready(d) -> bool:
+                nonlocal cookies_ok
+                current_url = d.current_url
+                # Wait until we're completely off the login page and on the target domain
                 if "login.microsoftonline" in current_url:
-                    time.sleep(2)
-                    continue
-
-                # SECOND: Now we're on the target domain - check for cookies
-                # This works for both Office 365 (outlook.office.com) and on-premise (e.g., mail.ext.icrc.org)
-                base_domain = self.base_url.replace("https://", "").replace("http://", "").split("/")[0]
-                is_on_target_domain = base_domain in current_url or "outlook.office" in current_url
-                
-                if is_on_target_domain:
-                    # Check cookies only when we're on the target domain
-                    all_cookies = driver.get_cookies()
-                    for cookie in all_cookies:
-                        if cookie["name"] in self.required_cookies:
-                            if cookie["name"] not in cookies_found:
-                                cookies_found[cookie["name"]] = cookie["value"]
-                                print(f"⏳ Found cookie: {cookie['name']}")
-
-                    # THIRD: Check if all cookies are present AND page is loaded
-                    if len(cookies_found) >= len(self.required_cookies):
-                        # Give extra time for page to fully load after redirect
-                        if not initial_wait_done:
-                            print("⏳ All cookies found, waiting for page to fully load...")
-                            initial_wait_done = True
-                            time.sleep(5)  # Wait 5 seconds for page to settle
-
-                        # Try to detect if the page is truly loaded by checking title
-                        try:
-                            page_title = driver.title.lower()
-                            if any(keyword in page_title for keyword in ['outlook', 'inbox', 'mail', 'calendar', 'owa']):
-                                print(f"✅ OWA fully loaded (Title: {driver.title[:50]})")
-                                owa_fully_loaded = True
-                                break
-                        except:
-                            pass
+                    return False
+                if self._base_domain not in current_url and "outlook.office" not in current_url:
+                    return False
+                captured["cookies"] = d.get_cookies()
+                names_now = {c["name"] for c in captured["cookies"]}
+                # Only re-check the required set when the cookie jar changed
+                if names_now != seen_names:
+                    seen_names.clear()
+                    seen_names.update(names_now)
+                    cookies_ok = self._required_set.issubset(names_now)
+                if not cookies_ok:
+                    return False
+                # A mailbox title means OWA has finished loading after the redirect
+                return _OWA_TITLE_RE.search(d.title) is not None
 
-                time.sleep(2)
+            try:
+                WebDriverWait(
+                    driver,
+                    self.login_timeout,
+                    poll_frequency=0.25,
+                    ignored_exceptions=(WebDriverException,),
+                ).until(ready)
+            except TimeoutException:
+                missing = self._required_set - seen_names
+                if missing:
+                    raise AuthenticationError(
+                        f"Timed out after {self.login_timeout:.0f}s waiting for required "
+                        f"cookies: {', '.join(sorted(missing))}"
+                    )
+                raise AuthenticationError(
+                    f"Timeout waiting for authentication, URL: {driver.current_url[:50]}"
+                )
+            logger.info("⏳ Found cookies: %s", ", ".join(self.required_cookies))
+            logger.info("✅ OWA fully loaded (Title: %s)", driver.title[:50])
 
-            print(f"✅ Authentication complete! Extracting tokens...")
+            logger.info("✅ Authentication complete! Extracting tokens...")
 
-            # Save all cookies
-            all_cookie_dict = {c["name"]: c["value"] for c in driver.get_cookies()}
+            # Save all cookies (as captured when the required ones appeared)
+            all_cookie_dict = {c["name"]: c["value"] for c in captured["cookies"]}
 
             # CRITICAL: Extract X-OWA-CANARY token - required for all OWA API calls
             # For Office 365 OWA, the canary is obtained via fetch API with credentials
-            canary_token = None
-            
-            # Method 1: Try fetch to get canary from response headers
-            try:
-                print("⏳ Fetching X-OWA-CANARY via service endpoint...")
-                canary_token = driver.execute_script("""
-                    return new Promise((resolve) => {
-                        fetch('/owa/service.svc?action=GetOwaUserConfiguration', {
-                            method: 'POST',
-                            credentials: 'include',
-                            headers: {
-                                'Content-Type': 'application/json',
-                                'Action': 'GetOwaUserConfiguration'
-                            },
-                            body: JSON.stringify({
-                                "__type": "GetOwaUserConfigurationRequest:#Exchange",
-                                "Header": {
-                                    "__type": "JsonRequestHeaders:#Exchange",
-                                    "RequestServerVersion": "Exchange2013"
-                                },
-                                "Body": {
-                                    "__type": "GetOwaUserConfigurationRequest:#Exchange",
-                                    "UserConfigurationName": {"__type": "UserConfigurationName:#Exchange", "Name": "OWA.ViewStateConfiguration", "DistinguishedFolderId": {"__type": "DistinguishedFolderId:#Exchange", "Id": "root"}}
-                                }
-                            })
-                        })
-                        .then(resp => {
-                            // The canary is in the response header
-                            let canary = resp.headers.get('X-OWA-CANARY');
-                            if (canary) {
-                                resolve(canary);
-                            } else {
-                                // Also check cookies that might have been set
-                                let cookies = document.cookie.split(';');
-                                for (let c of cookies) {
-                                    if (c.trim().startsWith('X-OWA-CANARY=')) {
-                                        resolve(c.trim().split('=')[1]);
-                                        return;
-                                    }
-                                }
-                                resolve(null);
-                            }
-                        })
-                        .catch(() => resolve(null));
-                        
-                        // Timeout after 5 seconds
-                        setTimeout(() => resolve(null), 5000);
-                    });
-                """)
-                if canary_token:
-                    print(f"✅ Found X-OWA-CANARY from service endpoint")
-            except Exception as e:
-                logger.debug(f"Could not get canary from fetch: {e}")
-
-            # Method 2: Check if it appeared as a cookie after the fetch
-            if not canary_token:
-                time.sleep(1)
-                for cookie in driver.get_cookies():
-                    if cookie["name"] == "X-OWA-CANARY":
-                        canary_token = cookie["value"]
-                        all_cookie_dict["X-OWA-CANARY"] = canary_token
-                        print(f"✅ Found X-OWA-CANARY in cookies after fetch")
-                        break
-
-            # Method 3: Try localStorage
-            if not canary_token:
-                try:
-                    canary_token = driver.execute_script(
-                        "return window.localStorage.getItem('x-owa-canary') || "
-                        "window.localStorage.getItem('X-OWA-CANARY');"
-                    )
-                    if canary_token:
-                        print(f"✅ Found X-OWA-CANARY in localStorage")
-                except Exception as e:
-                    logger.debug(f"Could not get canary from localStorage: {e}")
-
-            # Method 4: Try to extract from OWA's JavaScript boot data
-            if not canary_token:
-                try:
-                    canary_token = driver.execute_script("""
-                        try {
-                            // Try multiple known locations where OWA stores the canary
-                            if (window.g_CanaryValue) return window.g_CanaryValue;
-                            if (window.odataCanary) return window.odataCanary;
-                            if (window.__owa_boot && window.__owa_boot.canary) return window.__owa_boot.canary;
-                            if (typeof Boot !== 'undefined' && Boot.canary) return Boot.canary;
-                            
-                            // Search in script tags for canary patterns
-                            var scripts = document.getElementsByTagName('script');
-                            for (var i = 0; i < scripts.length; i++) {
-                                var content = scripts[i].innerHTML;
-                                var match = content.match(/"canary"\\s*:\\s*"([^"]+)"/);
-                                if (match) return match[1];
-                                match = content.match(/CanaryValue\\s*=\\s*"([^"]+)"/);
-                                if (match) return match[1];
-                                match = content.match(/x-owa-canary['"\\s:]+['"]([^'"]+)['"]/i);
-                                if (match) return match[1];
-                            }
-                            return null;
-                        } catch(e) { return null; }
-                    """)
-                    if canary_token:
-                        print(f"✅ Found X-OWA-CANARY in page JavaScript")
-                except Exception as e:
-                    logger.debug(f"Could not get canary from JS context: {e}")
-
-            # Method 5: Try sessionStorage
-            if not canary_token:
-                try:
-                    canary_token = driver.execute_script("""
-                        // Check sessionStorage
-                        for (let i = 0; i < sessionStorage.length; i++) {
-                            let key = sessionStorage.key(i);
-                            if (key.toLowerCase().includes('canary')) {
-                                return sessionStorage.getItem(key);
-                            }
-                        }
-                        // Check for OWA boot data in various forms
-                        try {
-                            if (window.O365Shell && window.O365Shell.FlexPane) {
-                                let data = window.O365Shell.FlexPane.HeaderButton;
-                                if (data && data.canary) return data.canary;
-                            }
-                        } catch(e) {}
-                        return null;
-                    """)
-                    if canary_token:
-                        print(f"✅ Found X-OWA-CANARY in sessionStorage")
-                except Exception as e:
-                    logger.debug(f"Could not get canary from sessionStorage: {e}")
-
-            # Method 6: Navigate to calendar and capture canary from network
-            if not canary_token:
-                try:
-                    print("⏳ Navigating to calendar to trigger canary generation...")
-                    driver.get(f"{self.base_url}/owa/?path=/calendar")
-                    time.sleep(3)
-                    
-                    # Check cookies again
-                    for cookie in driver.get_cookies():
-                        if cookie["name"] == "X-OWA-CANARY":
-                            canary_token = cookie["value"]
-                            all_cookie_dict["X-OWA-CANARY"] = canary_token
-                            print(f"✅ Found X-OWA-CANARY after calendar navigation")
-                            break
-                    
-                    # If still no canary, try extracting from OWA's internal state
-                    if not canary_token:
-                        canary_token = driver.execute_script("""
-                            // Try to find canary in OWA's React state or internal objects
-                            try {
-                                // Check window.__PRELOADED_STATE__ (common in React apps)
-                                if (window.__PRELOADED_STATE__ && window.__PRELOADED_STATE__.session) {
-                                    return window.__PRELOADED_STATE__.session.canary;
-                                }
-                            } catch(e) {}
-                            
-                            // Try to get it from a network request by triggering one
-                            try {
-                                // Look for any element that might have the canary as a data attribute
-                                let allElements = document.querySelectorAll('[data-canary]');
-                                if (allElements.length > 0) {
-                                    return allElements[0].getAttribute('data-canary');
-                                }
-                            } catch(e) {}
-                            
-                            // Check all script tags for canary patterns
-                            let scripts = document.getElementsByTagName('script');
-                            for (let i = 0; i < scripts.length; i++) {
-                                let content = scripts[i].textContent || scripts[i].innerHTML;
-                                if (content) {
-                                    // Look for canary in JSON-like structures
-                                    let patterns = [
-                                        /"canary"\\s*:\\s*"([^"]+)"/,
-                                        /'canary'\\s*:\\s*'([^']+)'/,
-                                        /canary['"]\\s*:\\s*['"]([\w\\-\\.]+)['"]/,
-                                        /X-OWA-CANARY['"]\\s*:\\s*['"]([\w\\-\\.]+)['"]/i
-                                    ];
-                                    for (let pattern of patterns) {
-                                        let match = content.match(pattern);
-                                        if (match) return match[1];
-                                    }
-                                }
-                            }
-                            return null;
-                        """)
-                        if canary_token:
-                            print(f"✅ Found X-OWA-CANARY from page analysis")
-                    
-                    # Update all cookies after navigation
-                    if canary_token:
-                        all_cookie_dict = {c["name"]: c["value"] for c in driver.get_cookies()}
-                except Exception as e:
-                    logger.debug(f"Calendar navigation failed: {e}")
-                except Exception as e:
-                    logger.debug(f"Calendar navigation failed: {e}")
+            canary_token = self._extract_canary(driver)
+            # Don't let network events pile up in a browser that is kept or pooled
+            _drain_performance_log(driver)
 
             if canary_token:
                 all_cookie_dict["X-OWA-CANARY"] = canary_token
-                print(f"✅ X-OWA-CANARY token captured: {canary_token[:30]}...")
+                self._cache_canary(canary_token)
+                logger.info("✅ X-OWA-CANARY token captured: %s...", canary_token[:30])
             else:
-                print("⚠️  WARNING: Could not find X-OWA-CANARY token!")
                 if self.use_browser_api:
-                    print("   Browser will stay open for API calls.")
+                    logger.warning(
+                        "⚠️  Could not find X-OWA-CANARY token! "
+                        "Browser will stay open for API calls."
+                    )
                 else:
-                    print("   OWA API calls may fail with 401 Unauthorized.")
+                    logger.warning(
+                        "⚠️  Could not find X-OWA-CANARY token! "
+                        "OWA API calls may fail with 401 Unauthorized."
+                    )
 
-            # If use_browser_api is enabled, keep the browser open
+            # Without a canary the reader falls back to browser API calls, so
+            # keep this browser for them rather than cold-starting another one
             if self.use_browser_api and not canary_token:
-                print("✅ Keeping browser open for API calls (use_browser_api=true)")
+                logger.info("✅ Keeping browser open for API calls (use_browser_api=true)")
+                # Navigate to calendar for API calls unless already there
+                if "calendar" not in driver.current_url.lower():
+                    driver.get(f"{self.base_url}/owa/?path=/calendar")
+                    _wait_ready(driver)
+                keep_driver = True
                 self._driver = driver
-                # Navigate to calendar for API calls
-                driver.get(f"{self.base_url}/owa/?path=/calendar")
-                time.sleep(2)
+                self._driver_profile = profile_dir
             else:
-                print(f"✅ Closing browser...")
-                driver.quit()
+                logger.info("✅ Closing browser...")
 
             self.save_cookies(all_cookie_dict)
+            succeeded = True
             return all_cookie_dict
 
         except Exception as e:
-            logger.error(f"Browser automation failed: {e}")
-            try:
-                driver.quit()
-            except:
-                pass
+            logger.error("Browser automation failed: %s", e)
+            if keep_driver:
+                keep_driver = False
+                self._driver = None
+                self._driver_profile = None
             raise AuthenticationError(f"Failed to get cookies from browser: {e}") from e
-    
+        finally:
+            # Single shutdown point for every path that does not hand the driver on.
+            # A healthy browser goes back to the pool for the next login.
+            if not keep_driver:
+                if succeeded:
+                    self._release_driver(driver, profile_dir)
+                else:
+                    self._discard_driver(driver, profile_dir)
+
+    def _extract_canary(self, driver) -> Optional[str]:
+        """
+        Find the X-OWA-CANARY token for the logged-in OWA session.
+
+        The cheap in-page sources are tried first and the calendar navigation
+        only runs as a last resort; the first source that yields a token wins.
+
+        Args:
+            driver: WebDriver instance on an authenticated OWA page
+
+        Returns:
+            Canary token, or None if no method found it
+        """
+        from selenium.webdriver.support.ui import WebDriverWait
+
+        # Method 0: Read it from a response header OWA already sent during login
+        canary_token = _canary_from_network_log(driver)
+        if canary_token:
+            logger.info("✅ Found X-OWA-CANARY in network response headers")
+            return canary_token
+
+        # Method 1: Start a fetch that returns the canary in its response
+        # headers. It runs in the page while the local probes below execute;
+        # the outcome lands in window.__canaryResult (null when not found).
+        fetch_started = False
+        try:
+            logger.info("⏳ Fetching X-OWA-CANARY via service endpoint...")
+            driver.execute_script("""
+                window.__canaryResult = undefined;
+                // Give up after 5 seconds, cancelling the request itself
+                const ctrl = new AbortController();
+                const tid = setTimeout(() => ctrl.abort(), 5000);
+                const done = (value) => {
+                    clearTimeout(tid);
+                    if (window.__canaryResult === undefined) window.__canaryResult = value || null;
+                };
+                fetch('/owa/service.svc?action=GetOwaUserConfiguration', {
+                    method: 'POST',
+                    credentials: 'include',
+                    signal: ctrl.signal,
+                    headers: {
+                        'Content-Type': 'application/json',
+                        'Action': 'GetOwaUserConfiguration'
+                    },
+                    body: JSON.stringify({
+                        "__type": "GetOwaUserConfigurationRequest:#Exchange",
+                        "Header": {
+                            "__type": "JsonRequestHeaders:#Exchange",
+                            "RequestServerVersion": "Exchange2013"
+                        },
+                        "Body": {
+                            "__type": "GetOwaUserConfigurationRequest:#Exchange",
+                            "UserConfigurationName": {"__type": "UserConfigurationName:#Exchange", "Name": "OWA.ViewStateConfiguration", "DistinguishedFolderId": {"__type": "DistinguishedFolderId:#Exchange", "Id": "root"}}
+                        }
+                    })
+                })
+                .then(resp => {
+                    // The canary is in the response header
+                    let canary = resp.headers.get('X-OWA-CANARY');
+                    if (canary) {
+                        done(canary);
+                        return;
+                    }
+                    // Also check cookies that might have been set
+                    for (let c of document.cookie.split(';')) {
+                        if (c.trim().startsWith('X-OWA-CANARY=')) {
+                            done(c.trim().split('=')[1]);
+                            return;
+                        }
+                    }
+                    done(null);
+                })
+                .catch(() => done(null));
+            """)
+            fetch_started = True
+        except Exception as e:
+            logger.debug("Could not start canary fetch: %s", e)
+
+        # Methods 3-5: page globals, web storage and inline scripts, checked
+        # in a single WebDriver round trip while the fetch is in flight
+        try:
+            canary_token = driver.execute_script(COMBINED_CANARY_JS)
+            if canary_token:
+                logger.info("✅ Found X-OWA-CANARY in page state")
+                return canary_token
+        except Exception as e:
+            logger.debug("Could not get canary from page state: %s", e)
+
+        # Collect the fetch outcome; wrapping it in an array keeps a null
+        # result truthy so the wait ends as soon as the fetch settles
+        if fetch_started:
+            try:
+                outcome = WebDriverWait(driver, 6, poll_frequency=0.1).until(
+                    lambda d: d.execute_script(
+                        "return window.__canaryResult === undefined"
+                        " ? null : [window.__canaryResult];"
+                    )
+                )
+                if outcome[0]:
+                    logger.info("✅ Found X-OWA-CANARY from service endpoint")
+                    return outcome[0]
+            except Exception as e:
+                logger.debug("Could not get canary from fetch: %s", e)
+
+        # Method 2: Check if it appeared as a cookie after the fetch
+        cookie = _wait_for_cookie(driver, "X-OWA-CANARY", timeout=2)
+        if cookie:
+            logger.info("✅ Found X-OWA-CANARY in cookies after fetch")
+            return cookie["value"]
+
+        # Method 6: Navigate to calendar and capture canary from network
+        try:
+            logger.info("⏳ Navigating to calendar to trigger canary generation...")
+            driver.get(f"{self.base_url}/owa/?path=/calendar")
+            _wait_ready(driver)
+
+            # Check cookies again
+            cookie = _wait_for_cookie(driver, "X-OWA-CANARY", timeout=3)
+            if cookie:
+                canary_token = cookie["value"]
+                logger.info("✅ Found X-OWA-CANARY after calendar navigation")
+            else:
+                # If still no canary, try extracting from OWA's internal state
+                canary_token = driver.execute_script("""
+                    // Try to find canary in OWA's React state or internal objects
+                    try {
+                        // Check window.__PRELOADED_STATE__ (common in React apps)
+                        if (window.__PRELOADED_STATE__ && window.__PRELOADED_STATE__.session) {
+                            return window.__PRELOADED_STATE__.session.canary;
+                        }
+                    } catch(e) {}
+
+                    // Try to get it from a network request by triggering one
+                    try {
+                        // Look for any element that might have the canary as a data attribute
+                        let allElements = document.querySelectorAll('[data-canary]');
+                        if (allElements.length > 0) {
+                            return allElements[0].getAttribute('data-canary');
+                        }
+                    } catch(e) {}
+
+                    // Check all script tags for canary patterns
+                    let scripts = document.getElementsByTagName('script');
+                    for (let i = 0; i < scripts.length; i++) {
+                        let content = scripts[i].textContent || scripts[i].innerHTML;
+                        if (content) {
+                            // Look for canary in JSON-like structures
+                            let patterns = [
+                                /"canary"\\s*:\\s*"([^"]+)"/,
+                                /'canary'\\s*:\\s*'([^']+)'/,
+                                /canary['"]\\s*:\\s*['"]([\w\\-\\.]+)['"]/,
+                                /X-OWA-CANARY['"]\\s*:\\s*['"]([\w\\-\\.]+)['"]/i
+                            ];
+                            for (let pattern of patterns) {
+                                let match = content.match(pattern);
+                                if (match) return match[1];
+                            }
+                        }
+                    }
+                    return null;
+                """)
+                if canary_token:
+                    logger.info("✅ Found X-OWA-CANARY from page analysis")
+
+            return canary_token or None
+        except Exception as e:
+            logger.debug("Calendar navigation failed: %s", e)
+
+        return None
+
+    def _cache_canary(self, canary: str) -> None:
+        """Remember an X-OWA-CANARY token so later fetches can skip the page search."""
+        self._cached_canary = canary
+        self._cached_canary_time = time.time()
+
+    def _get_cached_canary(self) -> Optional[str]:
+        """
+        Get a recently found X-OWA-CANARY token.
+
+        Falls back to the token saved with the cookies, aged by the cookie
+        file's modification time.
+
+        Returns:
+            Canary token younger than CANARY_TTL, or None
+        """
+        now = time.time()
+        if self._cached_canary and now - self._cached_canary_time < CANARY_TTL:
+            return self._cached_canary
+
+        cookies = self._cookies or {}
+        canary = cookies.get("X-OWA-CANARY")
+        if canary and self._cookies_mtime and now - self._cookies_mtime / 1e9 < CANARY_TTL:
+            return canary
+        return None
+
+    def _fetch_events_rest(
+        self, driver, start_date: str, end_date: str
+    ) -> Optional[list[dict]]:
+        """
+        Fetch calendar events from the Outlook REST API v2.0 over HTTP.
+
+        Uses the cookies of the browser's OWA session on the shared keep-alive
+        session, so the request doesn't round-trip through the WebDriver
+        protocol. Only cookies scoped to the configured server's host are sent.
+
+        Args:
+            driver: WebDriver instance on the OWA site
+            start_date: Start date in ISO format (YYYY-MM-DDTHH:MM:SSZ)
+            end_date: End date in ISO format (YYYY-MM-DDTHH:MM:SSZ)
+
+        Returns:
+            List of events, or None if the request failed
+        """
+        cookies = {
+            c["name"]: c["value"]
+            for c in driver.get_cookies()
+            if _cookie_matches_host(c.get("domain", ""), self._base_domain)
+        }
+        try:
+            response = self._http_session().get(
+                f"{self.base_url}/api/v2.0/me/calendarview",
+                params={
+                    "startDateTime": start_date,
+                    "endDateTime": end_date,
+                    "$top": 500,
+                    "$select": REST_EVENT_FIELDS,
+                },
+                headers={"Accept": "application/json"},
+                cookies=cookies,
+                timeout=30,
+            )
+        except Exception as e:
+            print(f"⚠️  REST API v2.0 failed: {e}")
+            return None
+
+        if response.status_code != 200:
+            if response.status_code in (401, 440):
+                # Session expired in the browser; probe again next time
+                self._owa_reachable = None
+            print(f"⚠️  REST API v2.0 failed: REST API status {response.status_code}")
+            if response.text:
+                print(f"   Detail: {response.text[:200]}")
+            return None
+
+        try:
+            return json_utils.loads(response.content).get("value", [])
+        except (ValueError, AttributeError) as e:
+            print(f"⚠️  REST API v2.0 returned an unexpected body: {e}")
+            return None
+
+    def _owa_session_alive(self, driver) -> bool:
+        """
+        Check whether the browser already holds a working OWA session.
+
+        Sends a HEAD request to /owa/ from the current page instead of loading
+        the calendar SPA. The request has to be same-origin to carry the
+        session cookies, so a browser that is not on the OWA site yet always
+        takes the navigation path.
+
+        Args:
+            driver: WebDriver instance
+
+        Returns:
+            True if the session is known to work and navigation can be skipped
+        """
+        try:
+            if not driver.current_url.startswith(self.base_url):
+                return False
+            if (
+                self._owa_reachable
+                and time.monotonic() - self._owa_reachable_time < OWA_PROBE_TTL
+            ):
+                return True
+            status = driver.execute_script(OWA_PROBE_JS)
+        except Exception as e:
+            logger.debug("OWA session probe failed: %s", e)
+            return False
+
+        # Anything but a 200 (including a redirect to login) means navigating
+        logger.debug("OWA session probe status: %s", status)
+        self._owa_reachable = status == 200
+        self._owa_reachable_time = time.monotonic()
+        return self._owa_reachable
+
     def has_browser(self) -> bool:
         """Check if browser is available for API calls."""
         return self._driver is not None
     
     def close_browser(self) -> None:
-        """Close the browser if it's open."""
+        """Release the browser if it's open, returning it to the driver pool."""
         if self._driver:
-            try:
-                self._driver.quit()
-            except:
-                pass
+            self._release_driver(self._driver, self._driver_profile)
             self._driver = None
+            self._driver_profile = None
 
     def get_cookies(self, force_refresh: bool = False) -> dict[str, str]:
         """
@@ -506,6 +1347,11 @@ class SeleniumEWSAuth:
             logger.info("Forcing cookie refresh...")
             return self.fetch_cookies_from_browser()
 
+        # Cookies already loaded or fetched in this process, and the file on
+        # disk hasn't been replaced since (e.g. by another run)
+        if self._cookies is not None and self._cookie_file_mtime() == self._cookies_mtime:
+            return self._cookies
+
         # Try to load from cache first
         cookies = self.load_cookies()
 
@@ -531,36 +1377,20 @@ class SeleniumEWSAuth:
         This is used when use_browser_api is enabled and we have cached cookies
         but no canary token (Office 365 scenario).
         """
-        from selenium.webdriver.chrome.options import Options as ChromeOptions
+        from selenium.common.exceptions import TimeoutException, WebDriverException
+        from selenium.webdriver.support.ui import WebDriverWait
 
         headless_msg = " (headless)" if self.headless else ""
         print(f"🌐 Launching browser{headless_msg} for API calls...")
 
-        if self.browser == "edge":
-            try:
-                from selenium.webdriver.edge.options import Options
-                options = Options()
-                options.add_experimental_option("detach", False)
-                options.add_argument("--disable-blink-features=AutomationControlled")
-                if self.headless:
-                    options.add_argument("--headless=new")
-                    options.add_argument("--window-size=1920,1080")
-                driver = webdriver.Edge(options=options)
-            except ImportError:
-                raise AuthenticationError("Edge WebDriver not available")
-        else:
-            options = ChromeOptions()
-            options.add_experimental_option("detach", False)
-            options.add_argument("--disable-blink-features=AutomationControlled")
-            if self.headless:
-                options.add_argument("--headless=new")
-                options.add_argument("--window-size=1920,1080")
-            driver = webdriver.Chrome(options=options)
-        
+        options = self._build_options()
+        profile_dir = self._profile_dir
+        driver = self._build_driver(options, profile_dir)
+
         try:
             # Navigate to OWA first to set cookies on the right domain
             driver.get(f"{self.base_url}/owa/")
-            time.sleep(2)
+            _wait_ready(driver)
             
             # Add cookies (only ones that belong to this domain)
             for name, value in cookies.items():
@@ -568,89 +1398,144 @@ class SeleniumEWSAuth:
                     try:
                         driver.add_cookie({"name": name, "value": value})
                     except Exception as e:
-                        logger.debug(f"Could not add cookie {name}: {e}")
+                        logger.debug("Could not add cookie %s: %s", name, e)
             
             # Navigate to calendar and wait for authentication
             print("🔗 Navigating to calendar...")
             driver.get(f"{self.base_url}/owa/?path=/calendar")
             
-            # Wait for page to load
-            WebDriverWait(driver, 10).until(
-                lambda d: d.current_url != "data:," and d.current_url != "about:blank"
-            )
-            
             # Check if we're redirected to login
             if "login.microsoftonline" in driver.current_url:
                 print("🔐 Please complete authentication in the browser...")
-                # Wait for authentication to complete
-                max_wait = 600
-                start_time = time.time()
-                while "login.microsoftonline" in driver.current_url:
-                    if time.time() - start_time > max_wait:
-                        driver.quit()
-                        raise AuthenticationError("Authentication timeout")
-                    time.sleep(2)
-            
+
+            def _auth_complete(d) -> bool:
+                current_url = d.current_url
+                if "login.microsoftonline" in current_url:
+                    return False
+                if "outlook.office.com" in current_url:
+                    return True
+                return _OWA_TITLE_RE.search(d.title) is not None
+
             print("⏳ Waiting for calendar to load...")
-            max_wait = 300
-            start_time = time.time()
-            while "outlook.office.com" not in driver.current_url:
-                if time.time() - start_time > max_wait:
-                    raise AuthenticationError("Authentication timeout")
-                time.sleep(2)
-            
+            try:
+                WebDriverWait(
+                    driver,
+                    self.login_timeout,
+                    poll_frequency=0.5,
+                    ignored_exceptions=(WebDriverException,),
+                ).until(_auth_complete)
+            except TimeoutException:
+                raise AuthenticationError("Authentication timeout")
+
             # Store the driver for API calls
             self._driver = driver
+            self._driver_profile = profile_dir
             print("✅ Browser ready for API calls")
             
         except Exception as e:
-            logger.error(f"Failed to launch browser for API: {e}")
-            try:
-                driver.quit()
-            except:
-                pass
+            logger.error("Failed to launch browser for API: %s", e)
+            self._discard_driver(driver, profile_dir)
             raise
 
+    @classmethod
+    def _http_session(cls) -> "requests.Session":
+        """
+        Get the class-wide browser-like session, creating it on first use.
+
+        It is kept apart from the process-wide session so the browser
+        User-Agent is not applied to Graph and MSAL traffic.
+
+        Returns:
+            Shared requests.Session
+        """
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = create_session()
+                    session.headers["User-Agent"] = USER_AGENT
+                    cls._session = session
+        return cls._session
+
     def validate_cookies(self, cookies: dict[str, str]) -> bool:
         """
         Validate that cookies work by testing EWS endpoint.
 
+        A successful result is remembered for a few minutes, keyed by a digest
+        of the cookie values, so repeated checks of the same cookies don't hit
+        the server again.
+
         Args:
             cookies: Dictionary of cookies to test
 
         Returns:
             True if cookies are valid, False otherwise
         """
-        import requests
+        now = time.monotonic()
+        # Drop expired entries, then look up this exact cookie set
+        self._validation_cache = {
+            k: t for k, t in self._validation_cache.items() if now - t < self._validation_ttl
+        }
+        cache_key = hashlib.sha256(repr(sorted(cookies.items())).encode()).hexdigest()
+        if cache_key in self._validation_cache:
+            return True
+
+        # Shared keep-alive session: repeated validations reuse the TLS connection
+        session = self._http_session()
 
         try:
             url = f"{self.base_url}/EWS/Exchange.asmx"
-            response = requests.get(
+            # HEAD avoids downloading the WSDL body; only the status matters
+            response = session.head(
                 url,
                 cookies=cookies,
                 timeout=10,
                 allow_redirects=False,
             )
+            if response.status_code == 405:
+                # Endpoint doesn't allow HEAD: GET, but never read the body
+                response = session.get(
+                    url,
+                    cookies=cookies,
+                    timeout=10,
+                    allow_redirects=False,
+                    stream=True,
+                )
+                response.close()
 
-            # If we get 200 or see WSDL content, cookies work
-            if response.status_code == 200 or "wsdl" in response.text.lower():
+            if response.status_code == 200:
                 logger.info("✅ Cookies validated successfully")
+                self._validation_cache[cache_key] = time.monotonic()
                 return True
 
-            logger.warning(
-                f"Cookie validation returned status {response.status_code}"
-            )
+            logger.warning("Cookie validation returned status %s", response.status_code)
             return False
 
         except Exception as e:
-            logger.warning(f"Cookie validation failed: {e}")
+            logger.warning("Cookie validation failed: %s", e)
             return False
 
     def clear_cookies(self) -> None:
-        """Clear cached cookies."""
-        if self.cookie_file.exists():
+        """Clear cached cookies and the persistent browser profile."""
+        self._cookies = None
+        self._validation_cache.clear()
+        try:
             self.cookie_file.unlink()
             logger.info("Cookie cache cleared")
+        except FileNotFoundError:
+            pass
+
+        # Stop any browser still using the profile before deleting it
+        if self._driver is not None and self._driver_profile == self._profile_dir:
+            self._discard_driver(self._driver, self._profile_dir)
+            self._driver = None
+            self._driver_profile = None
+        with self._driver_pool_lock:
+            pooled = self._driver_pool.pop(self._pool_key(self._profile_dir), None)
+        if pooled is not None:
+            _quit_quietly(pooled)
+        if self._profile_dir.exists():
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            logger.info("Browser profile cleared: %s", self._profile_dir)
 
     def fetch_calendar_events_via_browser(
         self,
@@ -670,137 +1555,93 @@ class SeleniumEWSAuth:
         Returns:
             List of calendar events as dictionaries, or None if failed
         """
+        from selenium.common.exceptions import TimeoutException
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         # Reuse existing browser if available (from use_browser_api mode)
         if self._driver:
             print("📅 Using existing browser session for API calls...")
             driver = self._driver
+            profile_dir = self._driver_profile
             need_to_close = False
+            _drain_performance_log(driver)
         else:
             headless_msg = " (headless)" if self.headless else ""
             print(f"🌐 Opening new browser{headless_msg} to fetch calendar events...")
             need_to_close = True
 
-            # Create browser
-            if self.browser == "edge":
-                try:
-                    from selenium.webdriver.edge.options import Options
-                    options = Options()
-                    options.add_experimental_option("detach", False)
-                    options.add_argument("--disable-blink-features=AutomationControlled")
-                    if self.headless:
-                        options.add_argument("--headless=new")
-                        options.add_argument("--window-size=1920,1080")
-                    driver = webdriver.Edge(options=options)
-                except ImportError:
-                    raise AuthenticationError("Edge WebDriver not available")
-            else:
-                options = ChromeOptions()
-                options.add_experimental_option("detach", False)
-                options.add_argument("--disable-blink-features=AutomationControlled")
-                if self.headless:
-                    options.add_argument("--headless=new")
-                    options.add_argument("--window-size=1920,1080")
-                driver = webdriver.Chrome(options=options)
-        
+            options = self._build_options()
+            profile_dir = self._profile_dir
+            driver = self._build_driver(options, profile_dir)
+
         try:
-            # Navigate to OWA calendar if not already there
-            current_url = driver.current_url
-            if "calendar" not in current_url.lower():
-                calendar_url = f"{self.base_url}/owa/?path=/calendar"
-                print(f"🔗 Navigating to {calendar_url}...")
-                driver.get(calendar_url)
-            
-            # Wait for page to load and check if we need to authenticate
-            WebDriverWait(driver, 10).until(
-                lambda d: d.current_url != "data:," and d.current_url != "about:blank"
-            )
-            
-            # Check if we're redirected to login
-            if "login.microsoftonline" in driver.current_url:
-                print("🔐 Please complete authentication in the browser...")
-                # Wait for authentication to complete
-                max_wait = 600
-                start_time = time.time()
-                while "login.microsoftonline" in driver.current_url:
-                    if time.time() - start_time > max_wait:
+            if self._owa_session_alive(driver):
+                logger.info("OWA session already active, skipping calendar navigation")
+            else:
+                # Navigate to OWA calendar if not already there
+                current_url = driver.current_url
+                if "calendar" not in current_url.lower():
+                    calendar_url = f"{self.base_url}/owa/?path=/calendar"
+                    print(f"🔗 Navigating to {calendar_url}...")
+                    driver.get(calendar_url)
+
+                # Wait for page to load and check if we need to authenticate
+                WebDriverWait(driver, 10).until(
+                    lambda d: d.current_url != "data:," and d.current_url != "about:blank"
+                )
+
+                # Check if we're redirected to login
+                if "login.microsoftonline" in driver.current_url:
+                    print("🔐 Please complete authentication in the browser...")
+                    # Wait for authentication to complete
+                    try:
+                        WebDriverWait(driver, self.login_timeout, poll_frequency=0.5).until_not(
+                            EC.url_contains("login.microsoftonline")
+                        )
+                    except TimeoutException:
                         raise AuthenticationError("Authentication timeout")
-                    time.sleep(2)
-                
-                # Wait for OWA to load
-                time.sleep(5)
-            
-            # Wait for calendar page to be ready
-            print("⏳ Waiting for calendar to load...")
-        
-            max_wait = 300
-            start_time = time.time()
-            while "outlook.office.com" not in driver.current_url:
-                if time.time() - start_time > max_wait:
-                    raise AuthenticationError("Authentication timeout")
-                time.sleep(2)
-            
 
+                    # Wait for OWA to load
+                    _wait_ready(driver)
 
+                # Wait for calendar page to be ready
+                print("⏳ Waiting for calendar to load...")
+                try:
+                    WebDriverWait(driver, self.login_timeout, poll_frequency=0.5).until(
+                        EC.url_contains("outlook.office.com")
+                    )
+                except TimeoutException:
+                    raise AuthenticationError("Authentication timeout")
+                self._owa_reachable = True
+                self._owa_reachable_time = time.monotonic()
 
-            # Make the API call from within the browser using fetch
+            # Call the REST API directly with the browser's session cookies
             print("📅 Fetching calendar events...")
-            result = driver.execute_script(f"""
-                return new Promise((resolve, reject) => {{
-                    // Try Graph API first (works in OWA context)
-                    fetch('https://outlook.office.com/api/v2.0/me/calendarview?startDateTime={start_date}&endDateTime={end_date}&$top=500&$select=Id,Subject,Start,End,Location,Organizer,Attendees,IsAllDay,IsCancelled,ShowAs,Body,Categories,Recurrence', {{
-                        method: 'GET',
-                        credentials: 'include',
-                        headers: {{
-                            'Content-Type': 'application/json',
-                            'Accept': 'application/json'
-                        }}
-                    }})
-                    .then(response => {{
-                        console.log('REST API v2.0 status:', response.status);
-                        if (response.ok) {{
-                            return response.json().then(data => ({{status: response.status, data: data}}));
-                        }} else {{
-                            return response.text().then(text => ({{status: response.status, error: text}}));
-                        }}
-                    }})
-                    .then(result => {{
-                        if (result.data) {{
-                            resolve(JSON.stringify({{success: true, events: result.data.value || [], source: 'rest_v2'}}));
-                        }} else {{
-                            resolve(JSON.stringify({{success: false, error: 'REST API status ' + result.status, detail: result.error}}));
-                        }}
-                    }})
-                    .catch(error => {{
-                        console.error('Calendar API error:', error);
-                        resolve(JSON.stringify({{success: false, error: error.message}}));
-                    }});
-                    
-                    // Timeout after 30 seconds
-                    setTimeout(() => resolve(JSON.stringify({{success: false, error: 'timeout'}})), 30000);
-                }});
-            """)
-            
-            if result:
-                parsed = json.loads(result)
-                if parsed.get('success'):
-                    events = parsed.get('events', [])
-                    print(f"✅ Retrieved {len(events)} events via {parsed.get('source', 'unknown')}")
-                    if need_to_close:
-                        driver.quit()
-                    return events
-                else:
-                    print(f"⚠️  REST API v2.0 failed: {parsed.get('error')}")
-                    if parsed.get('detail'):
-                        print(f"   Detail: {str(parsed.get('detail'))[:200]}")
-            
+            events = self._fetch_events_rest(driver, start_date, end_date)
+            if events is not None:
+                print(f"✅ Retrieved {len(events)} events via rest_v2")
+                if need_to_close:
+                    self._release_driver(driver, profile_dir)
+                return events
+
             # Try alternative: Use OWA's internal API with more thorough canary search
             print("⏳ Trying OWA internal API...")
-            result = driver.execute_script(f"""
+            owa_api_js = f"""
+                const cachedCanary = arguments[0];
                 return new Promise((resolve, reject) => {{
+                    // Timeout after 30 seconds, cancelling the in-flight request
+                    const ctrl = new AbortController();
+                    const tid = setTimeout(() => {{
+                        ctrl.abort();
+                        resolve({{items: [], error: 'timeout', hasCanary: false}});
+                    }}, 30000);
+
                     (async function() {{
-                    // Get the canary from the page - try MANY locations
-                    let canary = '';
-                    try {{
+                    // Get the canary from the page - try MANY locations,
+                    // unless a previously found one was passed in
+                    let canary = cachedCanary || '';
+                    if (!canary) try {{
                         // Method 1: Common JS variables
                         if (window.g_CanaryValue) canary = window.g_CanaryValue;
                         else if (window.__owa_boot && window.__owa_boot.canary) canary = window.__owa_boot.canary;
@@ -869,13 +1710,17 @@ class SeleniumEWSAuth:
                     
                     let lastError = null;
                     let lastStatus = null;
-                    
+                    let authStatus = null;
+
+                    // Resolves with the parsed body, rejects so Promise.any moves on
                     async function tryEndpoint(endpoint) {{
+                        console.log('Trying endpoint:', endpoint);
+                        let response;
                         try {{
-                            console.log('Trying endpoint:', endpoint);
-                            const response = await fetch(endpoint, {{
+                            response = await fetch(endpoint, {{
                                 method: 'POST',
                                 credentials: 'include',
+                                signal: ctrl.signal,
                                 headers: {{
                                     'Content-Type': 'application/json',
                                     'Action': 'GetCalendarView',
@@ -899,62 +1744,76 @@ class SeleniumEWSAuth:
                                     }}
                                 }})
                             }});
-                            
-                            console.log('Endpoint', endpoint, 'status:', response.status);
-                            lastStatus = response.status;
-                            
-                            if (response.ok) {{
-                                const text = await response.text();
-                                if (text && text.trim()) {{
-                                    try {{
-                                        return {{success: true, data: JSON.parse(text)}};
-                                    }} catch(e) {{
-                                        lastError = 'Invalid JSON';
-                                    }}
-                                }}
-                            }} else {{
-                                lastError = 'HTTP ' + response.status;
-                            }}
                         }} catch(e) {{
                             console.error('Endpoint error:', e);
                             lastError = e.message;
+                            throw e;
+                        }}
+
+                        console.log('Endpoint', endpoint, 'status:', response.status);
+                        lastStatus = response.status;
+                        if (response.status === 401 || response.status === 440) {{
+                            authStatus = response.status;
+                        }}
+                        if (!response.ok) {{
+                            lastError = 'HTTP ' + response.status;
+                            throw new Error(lastError);
+                        }}
+
+                        const text = await response.text();
+                        try {{
+                            return {{endpoint: endpoint, status: response.status, data: JSON.parse(text)}};
+                        }} catch(e) {{
+                            lastError = 'Invalid JSON';
+                            throw e;
                         }}
-                        return {{success: false}};
                     }}
-                    
-                    // Try each endpoint
-                    for (const endpoint of endpoints) {{
-                        const result = await tryEndpoint(endpoint);
-                        if (result.success) {{
-                            let items = [];
-                            try {{
-                                const data = result.data;
-                                if (data.Body && data.Body.Items) {{
-                                    items = data.Body.Items;
-                                }} else if (data.Body && data.Body.ResponseMessages) {{
-                                    const msgs = data.Body.ResponseMessages.Items;
-                                    if (msgs && msgs[0] && msgs[0].RootFolder) {{
-                                        items = msgs[0].RootFolder.Items || [];
-                                    }}
-                                }}
-                            }} catch(e) {{
-                                console.error('Parse error:', e);
+
+                    // Query all endpoints at once; the first good answer wins
+                    let result;
+                    try {{
+                        result = await Promise.any(endpoints.map(tryEndpoint));
+                    }} catch(e) {{
+                        // All endpoints failed; an auth failure outranks a 404
+                        clearTimeout(tid);
+                        resolve({{items: [], error: lastError || 'all endpoints failed', status: authStatus || lastStatus, hasCanary: !!canary, canary: canary}});
+                        return;
+                    }}
+                    clearTimeout(tid);
+                    // Drop the requests still in flight
+                    ctrl.abort();
+
+                    let items = [];
+                    try {{
+                        const data = result.data;
+                        if (data.Body && data.Body.Items) {{
+                            items = data.Body.Items;
+                        }} else if (data.Body && data.Body.ResponseMessages) {{
+                            const msgs = data.Body.ResponseMessages.Items;
+                            if (msgs && msgs[0] && msgs[0].RootFolder) {{
+                                items = msgs[0].RootFolder.Items || [];
                             }}
-                            resolve(JSON.stringify({{items: items, status: lastStatus, hasCanary: !!canary, endpoint: endpoint}}));
-                            return;
                         }}
+                    }} catch(e) {{
+                        console.error('Parse error:', e);
                     }}
-                    
-                    // All endpoints failed
-                    resolve(JSON.stringify({{items: [], error: lastError, status: lastStatus, hasCanary: !!canary}}));
+                    resolve({{items: items, status: result.status, hasCanary: !!canary, canary: canary, endpoint: result.endpoint}});
                     }})();  // End of async IIFE
-                    
-                    setTimeout(() => resolve(JSON.stringify({{items: [], error: 'timeout', hasCanary: false}})), 30000);
                 }});
-            """)
-            
-            if result:
-                parsed = json.loads(result)
+            """
+            cached_canary = self._get_cached_canary()
+            parsed = driver.execute_script(owa_api_js, cached_canary)
+            if parsed and cached_canary and parsed.get('status') in (401, 440):
+                logger.info(
+                    "Cached X-OWA-CANARY rejected (HTTP %s), searching the page again",
+                    parsed.get('status'),
+                )
+                self._cached_canary = None
+                parsed = driver.execute_script(owa_api_js, None)
+
+            if parsed:
+                if parsed.get('canary') and not parsed.get('error'):
+                    self._cache_canary(parsed['canary'])
                 events = parsed.get('items', [])
                 error = parsed.get('error')
                 has_canary = parsed.get('hasCanary', False)
@@ -966,7 +1825,7 @@ class SeleniumEWSAuth:
                 elif len(events) > 0:
                     print(f"✅ Retrieved {len(events)} events via OWA API ({endpoint})")
                     if need_to_close:
-                        driver.quit()
+                        self._release_driver(driver, profile_dir)
                     return events
                 else:
                     print(f"📅 OWA API returned 0 events (endpoint: {endpoint}, hasCanary: {has_canary})")
@@ -976,111 +1835,7 @@ class SeleniumEWSAuth:
             # that month view suffers from (month view silently hides overflow).
             from datetime import datetime as _dt, timedelta as _td
 
-            print("⏳ Switching to week view...")
-            try:
-                driver.get(f"{self.base_url}/calendar/view/week")
-                time.sleep(3)
-                logger.info("Switched to week view for DOM extraction")
-            except Exception as e:
-                logger.warning(f"Failed to switch to week view: {e}")
-
-            # JavaScript to extract events from the current calendar view
-            extract_dom_js = """
-                let events = [];
-                try {
-                    const selectors = [
-                        '[role="button"][aria-label*="event"]',
-                        '[role="button"][aria-label*=", "][aria-label*=" to "]',
-                        '[data-automation-id="CalendarEventCard"]',
-                        '.ms-CalendarEvent'
-                    ];
-                    let foundElements = new Set();
-                    for (const selector of selectors) {
-                        const elements = document.querySelectorAll(selector);
-                        for (const el of elements) {
-                            const label = el.getAttribute('aria-label');
-                            if (label && label.length > 10 && label.includes(' to ')) {
-                                if (foundElements.has(label)) continue;
-                                foundElements.add(label);
-                                const parts = label.split(', ');
-                                if (parts.length >= 4) {
-                                    const subject = parts[0];
-                                    const timeRange = parts[1];
-                                    let dayName = '';
-                                    let monthDay = '';
-                                    let year = '';
-                                    let organizer = '';
-                                    let isRecurring = label.includes('Recurring event');
-                                    for (let i = 2; i < parts.length; i++) {
-                                        const part = parts[i].trim();
-                                        if (['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday'].some(d => part.startsWith(d))) {
-                                            dayName = part;
-                                        } else if (['January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October', 'November', 'December'].some(m => part.startsWith(m))) {
-                                            monthDay = part;
-                                        } else if (/^\\d{4}$/.test(part)) {
-                                            year = part;
-                                        } else if (part.startsWith('By ')) {
-                                            organizer = part.substring(3);
-                                        }
-                                    }
-                                    let startTime = '';
-                                    let endTime = '';
-                                    function to24h(time, period) {
-                                        if (!time) return '';
-                                        let [h, m] = time.split(':').map(Number);
-                                        if (period && period.toUpperCase() === 'PM' && h !== 12) h += 12;
-                                        if (period && period.toUpperCase() === 'AM' && h === 12) h = 0;
-                                        return String(h).padStart(2, '0') + ':' + String(m).padStart(2, '0');
-                                    }
-                                    const timeMatch12 = timeRange.match(/(\\d{1,2}:\\d{2})\\s*(AM|PM)?\\s+to\\s+(\\d{1,2}:\\d{2})\\s*(AM|PM)?/i);
-                                    if (timeMatch12) {
-                                        let startPeriod = timeMatch12[2] || timeMatch12[4] || 'PM';
-                                        let endPeriod = timeMatch12[4] || startPeriod;
-                                        startTime = to24h(timeMatch12[1], startPeriod);
-                                        endTime = to24h(timeMatch12[3], endPeriod);
-                                    } else {
-                                        const timeMatch24 = timeRange.match(/(\\d{1,2}:\\d{2})\\s+to\\s+(\\d{1,2}:\\d{2})/);
-                                        if (timeMatch24) {
-                                            startTime = timeMatch24[1].padStart(5, '0');
-                                            endTime = timeMatch24[2].padStart(5, '0');
-                                        }
-                                    }
-                                    let startDate = null;
-                                    let endDate = null;
-                                    if (monthDay && year) {
-                                        const monthNames = ['January', 'February', 'March', 'April', 'May', 'June',
-                                                           'July', 'August', 'September', 'October', 'November', 'December'];
-                                        const monthMatch = monthDay.match(/([A-Za-z]+)\\s+(\\d+)/);
-                                        if (monthMatch) {
-                                            const monthIdx = monthNames.findIndex(m => m.toLowerCase() === monthMatch[1].toLowerCase());
-                                            const day = parseInt(monthMatch[2]);
-                                            if (monthIdx >= 0 && day > 0) {
-                                                const datePrefix = year + '-' + String(monthIdx + 1).padStart(2, '0') + '-' + String(day).padStart(2, '0');
-                                                startDate = datePrefix + 'T' + (startTime || '00:00') + ':00';
-                                                endDate = datePrefix + 'T' + (endTime || '23:59') + ':00';
-                                            }
-                                        }
-                                    }
-                                    events.push({
-                                        Subject: subject,
-                                        Start: startDate ? {DateTime: startDate, TimeZone: 'UTC'} : null,
-                                        End: endDate ? {DateTime: endDate, TimeZone: 'UTC'} : null,
-                                        Organizer: organizer ? {EmailAddress: {Name: organizer}} : null,
-                                        IsRecurring: isRecurring,
-                                        _rawLabel: label,
-                                        _source: 'dom'
-                                    });
-                                }
-                            }
-                        }
-                    }
-                } catch(e) {
-                    console.error('DOM extraction error:', e);
-                }
-                return JSON.stringify(events);
-            """
-
-            # Calculate how many weeks to navigate forward
+            # Calculate how many weeks to read
             try:
                 start_dt = _dt.strptime(start_date[:10], "%Y-%m-%d")
                 end_dt = _dt.strptime(end_date[:10], "%Y-%m-%d")
@@ -1096,75 +1851,124 @@ class SeleniumEWSAuth:
                 current_week_end += _td(days=7)
 
             total_weeks = 1 + weeks_forward
+
+            # Deep link to each week's view, starting from the Monday of this week
+            week_monday = (now - _td(days=now.weekday())).date()
+            week_urls = []
+            for w in range(total_weeks):
+                day = week_monday + _td(weeks=w)
+                week_urls.append(
+                    f"{self.base_url}/calendar/view/week/{day.year}/{day.month}/{day.day}"
+                )
+
+            print("⏳ Switching to week view...")
+            try:
+                driver.get(week_urls[0])
+                _wait_week_rendered(driver)
+                logger.info("Switched to week view for DOM extraction")
+            except Exception as e:
+                logger.warning("Failed to switch to week view: %s", e)
+
             all_dom_events = []
             seen_labels = set()
 
             print(f"⏳ Extracting events from {total_weeks} week view(s)...")
 
-            # Extract current week
-            dom_events = driver.execute_script(extract_dom_js)
-            if dom_events:
-                week_parsed = json.loads(dom_events)
-                for event in week_parsed:
-                    raw = event.get("_rawLabel", "")
-                    if raw not in seen_labels:
-                        seen_labels.add(raw)
+            def collect(week_no: int, labels: Optional[list[str]]) -> None:
+                if not labels:
+                    logger.info("  Week %d/%d: no events found", week_no, total_weeks)
+                    return
+                added = duplicates = 0
+                for label in labels:
+                    if label in seen_labels:
+                        duplicates += 1
+                        continue
+                    seen_labels.add(label)
+                    event = _parse_event_label(label)
+                    if event is not None:
                         all_dom_events.append(event)
-                logger.info(f"  Week 1/{total_weeks} (current): {len(all_dom_events)} events")
+                        added += 1
+                logger.info(
+                    "  Week %d/%d: %d new events (%d total, %d duplicates)",
+                    week_no,
+                    total_weeks,
+                    added,
+                    len(labels),
+                    duplicates,
+                )
 
-            # Click forward through remaining weeks
-            for w in range(weeks_forward):
-                try:
-                    # Find the "Go to next week" button in the main calendar view
-                    next_btn = None
-                    try:
-                        next_btn = driver.find_element("css selector", 'button[aria-label*="next week" i]')
-                    except Exception:
-                        pass
-
-                    if not next_btn:
-                        logger.warning(f"  Week {w+2}/{total_weeks}: could not find next-week button")
-                        break
-
-                    next_btn.click()
-                    time.sleep(4)
-
-                    dom_events = driver.execute_script(extract_dom_js)
-                    if dom_events:
-                        week_parsed = json.loads(dom_events)
-                        added = 0
-                        for event in week_parsed:
-                            raw = event.get("_rawLabel", "")
-                            if raw not in seen_labels:
-                                seen_labels.add(raw)
-                                all_dom_events.append(event)
-                                added += 1
-                        logger.info(f"  Week {w+2}/{total_weeks}: {added} new events ({len(week_parsed)} total, {len(week_parsed) - added} duplicates)")
+            # Extract current week
+            collect(1, _extract_week_events(driver))
+
+            # Load the remaining weeks in background tabs, a few at a time, so
+            # their page loads overlap instead of clicking through one by one
+            main_handle = driver.current_window_handle
+            later_weeks = week_urls[1:]
+            for batch_start in range(0, len(later_weeks), MAX_WEEK_TABS):
+                batch = later_weeks[batch_start:batch_start + MAX_WEEK_TABS]
+                # Window handle order isn't guaranteed to follow open order,
+                # so pick up each tab's handle right after opening it
+                tab_handles = []
+                for offset, url in enumerate(batch):
+                    known_handles = set(driver.window_handles)
+                    driver.execute_script("window.open(arguments[0], '_blank');", url)
+                    new_handles = set(driver.window_handles) - known_handles
+                    if len(new_handles) == 1:
+                        tab_handles.append((batch_start + offset + 2, new_handles.pop()))
                     else:
-                        logger.info(f"  Week {w+2}/{total_weeks}: no events found")
-                except Exception as e:
-                    logger.warning(f"  Week {w+2}/{total_weeks}: navigation failed: {e}")
+                        logger.warning(
+                            "  Week %d/%d: could not open a tab for %s",
+                            batch_start + offset + 2,
+                            total_weeks,
+                            url,
+                        )
+                        # Tabs that can't be told apart are not read
+                        for handle in new_handles:
+                            driver.switch_to.window(handle)
+                            driver.close()
+                        driver.switch_to.window(main_handle)
+
+                for week_no, handle in tab_handles:
+                    try:
+                        driver.switch_to.window(handle)
+                        _wait_week_rendered(driver)
+                        collect(week_no, _extract_week_events(driver))
+                    except Exception as e:
+                        logger.warning(
+                            "  Week %d/%d: extraction failed: %s", week_no, total_weeks, e
+                        )
+                    finally:
+                        try:
+                            driver.close()
+                        except Exception:
+                            pass
+                driver.switch_to.window(main_handle)
 
             if len(all_dom_events) > 0:
-                logger.info(f"Total DOM events extracted across all weeks: {len(all_dom_events)}")
+                logger.info("Total DOM events extracted across all weeks: %d", len(all_dom_events))
                 if need_to_close:
-                    driver.quit()
+                    self._release_driver(driver, profile_dir)
                 for event in all_dom_events:
-                    logger.debug(f"  {event['Subject']} @ {event['Start']['DateTime'] if event.get('Start') else '?'}")
+                    logger.debug(
+                        "  %s @ %s",
+                        event["Subject"],
+                        event["Start"]["DateTime"] if event.get("Start") else "?",
+                    )
                 return all_dom_events
             
             # Only close browser if we opened it ourselves (not in use_browser_api mode)
             if need_to_close:
-                driver.quit()
+                self._release_driver(driver, profile_dir)
             
             print("❌ Could not retrieve calendar events via any method")
             return []
             
         except Exception as e:
-            logger.error(f"Browser calendar fetch failed: {e}")
+            logger.error("Browser calendar fetch failed: %s", e)
             if need_to_close:
-                try:
-                    driver.quit()
-                except:
-                    pass
+                self._discard_driver(driver, profile_dir)
             return None
+
+
+# Pooled browsers outlive individual auth objects; close them when the process exits
+atexit.register(SeleniumEWSAuth.shutdown)
@@ -2,6 +2,7 @@
 
 import logging
 import sys
+import threading
 from pathlib import Path
 from typing import Optional
 
@@ -38,12 +39,18 @@ class TokenCacheManager:
         self.cache_location = cache_location
         self.cache_name = cache_name
         self.encrypted = encrypted
+        # Cache file path without extension, resolved to a plain string once
+        self._cache_file_prefix = str(Path(cache_location) / cache_name)
         self._cache: Optional[PersistedTokenCache] = None
+        self._lock = threading.Lock()
 
     def get_cache(self) -> PersistedTokenCache:
         """
         Get or create the token cache.
 
+        The same instance is returned to every caller, so all MSAL applications
+        built from this manager share one deserialized cache.
+
         Returns:
             Configured PersistedTokenCache instance
 
@@ -53,6 +60,17 @@ class TokenCacheManager:
         if self._cache is not None:
             return self._cache
 
+        with self._lock:
+            if self._cache is None:
+                self._cache = self._create_cache()
+            return self._cache
+
+    def _create_cache(self) -> PersistedTokenCache:
+        """Create the persisted token cache for the configured location.
+
+        Raises:
+            TokenCacheError: If cache initialization fails
+        """
         try:
             # Create cache directory if it doesn't exist
             self.cache_location.mkdir(parents=True, exist_ok=True)
@@ -61,34 +79,34 @@ class TokenCacheManager:
                 # Use platform-specific encrypted storage
                 if sys.platform == "win32":
                     persistence = FilePersistence(
-                        self.cache_location / f"{self.cache_name}.bin"
+                        f"{self._cache_file_prefix}.bin"
                     )
                 elif sys.platform == "darwin":
                     persistence = KeychainPersistence(
-                        self.cache_location / f"{self.cache_name}.bin",
+                        f"{self._cache_file_prefix}.bin",
                         "calendar_sync",
                         self.cache_name,
                     )
                 else:  # Linux
                     try:
                         persistence = LibsecretPersistence(
-                            self.cache_location / f"{self.cache_name}.bin",
+                            f"{self._cache_file_prefix}.bin",
                             schema_name="calendar_sync",
                             attributes={"app": self.cache_name},
                         )
                     except Exception:
                         persistence = FilePersistence(
-                            self.cache_location / f"{self.cache_name}.bin"
+                            f"{self._cache_file_prefix}.bin"
                         )
             else:
                 # Use unencrypted file storage
                 persistence = FilePersistence(
-                    self.cache_location / f"{self.cache_name}.json"
+                    f"{self._cache_file_prefix}.json"
                 )
 
-            self._cache = PersistedTokenCache(persistence)
+            cache = PersistedTokenCache(persistence)
             logger.info(f"Token cache initialized at {self.cache_location}")
-            return self._cache
+            return cache
 
         except Exception as e:
             raise TokenCacheError(f"Failed to initialize token cache: {e}") from e
@@ -1,5 +1,8 @@
 """Configuration management for Calendar Sync application."""
 
+import logging
+import os
+import threading
 from pathlib import Path
 from typing import Any, Optional
 
@@ -8,8 +11,49 @@ from dotenv import load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Prefer the LibYAML-backed loader; PyYAML builds without it fall back to pure Python
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Parsed sync_config.yaml documents keyed by path, tagged with the
+# (st_mtime_ns, st_size, st_ino) they were parsed from so edits are picked up.
+_yaml_cache: dict[Path, tuple[int, int, int, dict[str, Any]]] = {}
+_yaml_cache_lock = threading.Lock()
+
+
+def _load_yaml(path: Path) -> dict[str, Any]:
+    """
+    Load a YAML file, reusing the previous parse if the file is unchanged.
+
+    Parses are cached in-process only, keyed by the file's stat. The returned
+    dict is shared between callers and must not be mutated.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed YAML document (empty dict for an empty file)
+    """
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(path)
+        if cached is not None and cached[:3] == stamp:
+            return cached[3]
+
+        with open(path) as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
+
+        _yaml_cache[path] = (*stamp, data)
+        return data
+
 
 class M365Config(BaseSettings):
     """Microsoft 365 configuration."""
@@ -114,6 +158,9 @@ class AccountConfig:
         # Useful when SSO works automatically and no user interaction is needed
         self.headless: bool = data.get("headless", False)
 
+        # Seconds to wait for the interactive login before giving up
+        self.login_timeout: float = float(data.get("login_timeout", 300))
+
         # Day filtering - exclude events on certain days of the week
         # Format: list of day abbreviations: Mon, Tue, Wed, Thu, Fri, Sat, Sun
         exclude_days_raw = data.get("exclude_days", [])
@@ -123,6 +170,14 @@ class AccountConfig:
         include_days_raw = data.get("include_days", [])
         self.include_days: set[int] = self._parse_days(include_days_raw)
 
+        # 7-bit mask of allowed weekdays (bit 0 = Monday) combining both lists
+        mask = 0
+        for day in self.include_days or range(7):
+            mask |= 1 << day
+        for day in self.exclude_days:
+            mask &= ~(1 << day)
+        self.day_mask: int = mask
+
     @staticmethod
     def _parse_days(days: list) -> set[int]:
         """Parse day names to weekday numbers (0=Monday, 6=Sunday)."""
@@ -153,11 +208,10 @@ class SyncConfig:
         self.target: Optional[str] = None
         self.lookback_days: int = 0
         self.lookahead_days: int = 7
-        self.skip_subjects: list[str] = []
+        self.skip_subjects: frozenset[str] = frozenset()
 
         if config_path.exists():
-            with open(config_path) as f:
-                data = yaml.safe_load(f) or {}
+            data = _load_yaml(config_path)
 
             for name, acct_data in data.get("accounts", {}).items():
                 self.accounts[name] = AccountConfig(name, acct_data)
@@ -167,7 +221,9 @@ class SyncConfig:
             self.target = sync_data.get("target")
             self.lookback_days = sync_data.get("lookback_days", 0)
             self.lookahead_days = sync_data.get("lookahead_days", 7)
-            self.skip_subjects = [s.lower().strip() for s in data.get("skip_subjects", [])]
+            self.skip_subjects = frozenset(
+                s.lower().strip() for s in data.get("skip_subjects", []) or []
+            )
 
     @property
     def has_config(self) -> bool:
@@ -1,10 +1,9 @@
 """Normalized calendar event data model."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
-import pytz
 from pydantic import BaseModel, Field
 
 
@@ -89,7 +88,7 @@ class CalendarEvent(BaseModel):
     last_modified: Optional[datetime] = None
 
     # Sync metadata
-    sync_timestamp: datetime = Field(default_factory=lambda: datetime.now(pytz.utc))
+    sync_timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
     model_config = {
         "json_encoders": {
@@ -107,16 +106,19 @@ class CalendarEvent(BaseModel):
         Returns:
             New CalendarEvent with converted times
         """
+        # pytz is only needed for named zones; imported here to keep model import light
+        import pytz
+
         tz = pytz.timezone(target_tz)
         event_copy = self.model_copy(deep=True)
 
         if self.start.tzinfo is None:
-            event_copy.start = pytz.utc.localize(self.start).astimezone(tz)
+            event_copy.start = self.start.replace(tzinfo=timezone.utc).astimezone(tz)
         else:
             event_copy.start = self.start.astimezone(tz)
 
         if self.end.tzinfo is None:
-            event_copy.end = pytz.utc.localize(self.end).astimezone(tz)
+            event_copy.end = self.end.replace(tzinfo=timezone.utc).astimezone(tz)
         else:
             event_copy.end = self.end.astimezone(tz)
 
@@ -1,6 +1,7 @@
 """Abstract base class for calendar readers."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Optional
 
@@ -45,6 +46,33 @@ class CalendarReader(ABC):
             CalendarReadError: If reading events fails
         """
 
+    def iter_events(
+        self,
+        calendar_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[CalendarEvent]:
+        """
+        Iterate over events from calendar(s).
+
+        The default implementation yields from read_events(); readers that page
+        through results can override this to yield events as pages arrive.
+
+        Args:
+            calendar_id: Calendar ID (None for default calendar)
+            start_date: Start date for event range
+            end_date: End date for event range
+
+        Yields:
+            Normalized CalendarEvent objects
+
+        Raises:
+            CalendarReadError: If reading events fails
+        """
+        yield from self.read_events(
+            calendar_id=calendar_id, start_date=start_date, end_date=end_date
+        )
+
     @abstractmethod
     def get_event(
         self, event_id: str, calendar_id: Optional[str] = None
@@ -8,7 +8,7 @@ from typing import Any, Optional
 
 import requests
 
-from ..auth.selenium_auth import SeleniumEWSAuth
+from ..auth.selenium_auth import USER_AGENT, SeleniumEWSAuth
 from ..config import EWSConfig
 from ..models.calendar import Calendar
 from ..models.event import Attendee, CalendarEvent, EventStatus, Location
@@ -18,8 +18,6 @@ from .base import CalendarReader
 
 logger = logging.getLogger(__name__)
 
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/144.0.0.0 Safari/537.36"
-
 # Days of week mapping for recurrence patterns
 DAYS_OF_WEEK = {
     "Sunday": 6, "Monday": 0, "Tuesday": 1, "Wednesday": 2,
@@ -598,7 +596,6 @@ class EWSSeleniumReader(CalendarReader):
                 
                 # Parse datetime strings - DOM times are in LOCAL timezone, not UTC
                 # Get local timezone for proper conversion
-                import pytz
                 from datetime import timezone as dt_timezone
                 try:
                     # Try to get local timezone
@@ -1,6 +1,7 @@
 """Microsoft 365 calendar reader using Graph API."""
 
 import logging
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Optional
 
@@ -98,6 +99,17 @@ class M365CalendarReader(CalendarReader):
         end_date: Optional[datetime] = None,
     ) -> list[CalendarEvent]:
         """Read events from M365 calendar."""
+        return list(
+            self.iter_events(calendar_id=calendar_id, start_date=start_date, end_date=end_date)
+        )
+
+    def iter_events(
+        self,
+        calendar_id: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[CalendarEvent]:
+        """Yield events from M365 calendar, normalizing each one as it is consumed."""
         try:
             # Get calendar reference
             if calendar_id:
@@ -127,13 +139,11 @@ class M365CalendarReader(CalendarReader):
             events_result = query.get().execute_query()
 
             # Transform to normalized model
-            result = []
+            count = 0
             for event in events_result:
-                normalized = self._transform_event(event)
-                result.append(normalized)
-
-            logger.info(f"Read {len(result)} events from M365")
-            return result
+                yield self._transform_event(event)
+                count += 1
+            logger.info(f"Read {count} events from M365")
 
         except Exception as e:
             raise CalendarReadError(f"Failed to read M365 events: {e}") from e
@@ -1,10 +1,9 @@
 """Date and time utilities for Calendar Sync application."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional
 
-import pytz
-
 
 def ensure_utc(dt: datetime) -> datetime:
     """
@@ -17,8 +16,8 @@ def ensure_utc(dt: datetime) -> datetime:
         UTC datetime
     """
     if dt.tzinfo is None:
-        return pytz.utc.localize(dt)
-    return dt.astimezone(pytz.utc)
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
 
 def get_sync_window(
@@ -35,9 +34,19 @@ def get_sync_window(
     Returns:
         Tuple of (start_date, end_date) in UTC
     """
-    now = datetime.now(pytz.utc)
+    now = datetime.now(timezone.utc)
     # Use start of day (midnight UTC) to include all events from that day
     today_midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+    return _sync_window(today_midnight, lookback_days, lookahead_days)
+
+
+@lru_cache(maxsize=4)
+def _sync_window(
+    today_midnight: datetime,
+    lookback_days: int,
+    lookahead_days: int,
+) -> tuple[datetime, datetime]:
+    """Compute the sync window for a given day (cached; keyed by the day itself)."""
     start = today_midnight - timedelta(days=lookback_days)
     # End at midnight of the last day to include all events
     end = today_midnight + timedelta(days=lookahead_days + 1)
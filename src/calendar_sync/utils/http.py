@@ -0,0 +1,71 @@
+"""Shared HTTP session utilities.
+
+A single requests.Session keeps TLS connections alive across the Graph, MSAL
+and EWS calls made during one run instead of opening a new connection per
+request.
+"""
+
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def create_session(
+    pool_connections: int = 8,
+    pool_maxsize: int = 32,
+    total_retries: int = 3,
+    backoff_factor: float = 0.5,
+) -> requests.Session:
+    """
+    Create a requests session with a sized connection pool and retries.
+
+    Retries cover connection errors and throttling/unavailable responses on
+    idempotent methods only; POST requests are never replayed automatically.
+
+    Args:
+        pool_connections: Number of per-host connection pools to cache
+        pool_maxsize: Maximum connections kept per host
+        total_retries: Maximum retry attempts per request
+        backoff_factor: Exponential backoff factor between retries
+
+    Returns:
+        Configured requests.Session
+    """
+    retry = Retry(
+        total=total_retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=(429, 500, 502, 503, 504),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Get the process-wide shared session, creating it on first use.
+
+    Returns:
+        Shared requests.Session
+    """
+    global _session
+
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = create_session()
+    return _session
@@ -0,0 +1,50 @@
+"""JSON encoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library json
+module otherwise. Both paths produce UTF-8 encoded bytes from dumps() and
+accept str or bytes in loads().
+"""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(obj: Any, *, indent: bool = False) -> bytes:
+    """
+    Serialize an object to JSON.
+
+    Args:
+        obj: JSON-serializable object
+        indent: Pretty-print with two-space indentation
+
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: str | bytes) -> Any:
+    """
+    Deserialize JSON from str or bytes.
+
+    Args:
+        data: JSON document
+
+    Returns:
+        Decoded Python object
+
+    Raises:
+        ValueError: If the document is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -9,10 +9,15 @@ inject the OS's native certificate store into Python's SSL context.
 import logging
 import platform
 import sys
+import threading
+from typing import Optional
 
 logger = logging.getLogger(__name__)
 
-_ssl_initialized = False
+# None until SSL setup has run, then whether truststore was injected
+_ssl_initialized: Optional[bool] = None
+# Reentrant: init_ssl() holds it while calling setup_ssl_truststore()
+_ssl_lock = threading.RLock()
 
 
 def setup_ssl_truststore() -> bool:
@@ -34,20 +39,23 @@ def setup_ssl_truststore() -> bool:
     if _ssl_initialized:
         return True
 
-    try:
-        import truststore
-        truststore.inject_into_ssl()
-        _ssl_initialized = True
-        logger.info(f"SSL truststore injected for {platform.system()}")
-        return True
-    except ImportError:
-        logger.warning(
-            "truststore package not installed. "
-            "If you encounter SSL certificate errors, install it with: pip install truststore"
-        )
-        return False
-    except Exception as e:
-        logger.warning(f"Failed to inject truststore: {e}")
+    with _ssl_lock:
+        if _ssl_initialized:
+            return True
+        try:
+            import truststore
+            truststore.inject_into_ssl()
+            _ssl_initialized = True
+            logger.info(f"SSL truststore injected for {platform.system()}")
+            return True
+        except ImportError:
+            logger.warning(
+                "truststore package not installed. "
+                "If you encounter SSL certificate errors, install it with: pip install truststore"
+            )
+        except Exception as e:
+            logger.warning(f"Failed to inject truststore: {e}")
+        _ssl_initialized = False
         return False
 
 
@@ -55,9 +63,23 @@ def init_ssl():
     """
     Initialize SSL handling based on the current platform.
 
-    This should be called early in application startup, before any
-    HTTPS connections are made.
+    This must be called before the first HTTPS connection is made. It is
+    idempotent and cheap after the first call, so callers that are about to
+    create network clients can invoke it unconditionally.
     """
+    if _ssl_initialized is not None:
+        return
+
+    with _ssl_lock:
+        if _ssl_initialized is not None:
+            return
+        _init_ssl()
+
+
+def _init_ssl():
+    """Run the platform-specific SSL setup (see init_ssl)."""
+    global _ssl_initialized
+
     system = platform.system()
 
     if system == "Windows":
@@ -78,3 +100,4 @@ def init_ssl():
         except ImportError:
             # On Linux, this is usually fine without truststore
             logger.debug("truststore not available on Linux, using default SSL")
+            _ssl_initialized = False
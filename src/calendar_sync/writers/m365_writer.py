@@ -1,6 +1,7 @@
 """Microsoft 365 calendar writer using Graph API directly."""
 
 import logging
+import time
 from datetime import datetime
 from typing import Optional
 
@@ -8,6 +9,7 @@ import requests
 
 from ..auth.msal_auth import M365AuthProvider
 from ..models.event import CalendarEvent
+from ..utils import json_utils
 from ..utils.exceptions import CalendarWriteError
 from .base import CalendarWriter
 
@@ -15,6 +17,25 @@ logger = logging.getLogger(__name__)
 
 GRAPH_BASE = "https://graph.microsoft.com/v1.0"
 
+# Graph JSON batching accepts at most 20 requests per $batch call
+# See https://learn.microsoft.com/en-us/graph/json-batching
+BATCH_SIZE = 20
+
+# Sub-requests answered with these statuses are retried after Retry-After
+RETRYABLE_STATUSES = frozenset({429, 503, 504})
+BATCH_MAX_RETRIES = 3
+
+
+def _parse_retry_after(headers: dict) -> float:
+    """Get the Retry-After delay in seconds from a batch sub-response's headers."""
+    for name, value in headers.items():
+        if name.lower() == "retry-after":
+            try:
+                return float(value)
+            except (TypeError, ValueError):
+                return 0.0
+    return 0.0
+
 
 # M365 preset color names -> API values
 # See https://learn.microsoft.com/en-us/graph/api/resources/outlookcategory
@@ -50,9 +71,16 @@ CATEGORY_COLORS = {
 class M365CalendarWriter(CalendarWriter):
     """Write events to Microsoft 365 using Graph API."""
 
-    def __init__(self, auth_provider: M365AuthProvider, primary_email: Optional[str] = None):
+    def __init__(
+        self,
+        auth_provider: M365AuthProvider,
+        primary_email: Optional[str] = None,
+        session: Optional[requests.Session] = None,
+    ):
         self.auth_provider = auth_provider
         self.primary_email = primary_email
+        # Reuse pooled keep-alive connections for all Graph calls
+        self.session = session or requests.Session()
         self.use_client_credentials = auth_provider.use_client_credentials
         self._existing_events: Optional[dict[str, str]] = None
         self._ensured_categories: set[str] = set()
@@ -87,7 +115,7 @@ class M365CalendarWriter(CalendarWriter):
         preset = CATEGORY_COLORS.get(color.lower(), color)
         # Check if category already exists
         url = f"{GRAPH_BASE}/{self._user_path}/outlook/masterCategories"
-        resp = requests.get(url, headers=self._headers())
+        resp = self.session.get(url, headers=self._headers())
         resp.raise_for_status()
         existing = {cat["displayName"]: cat for cat in resp.json().get("value", [])}
 
@@ -96,11 +124,11 @@ class M365CalendarWriter(CalendarWriter):
             cat = existing[name]
             if cat.get("color") != preset:
                 patch_url = f"{url}/{cat['id']}"
-                requests.patch(patch_url, headers=self._headers(), json={"color": preset})
+                self.session.patch(patch_url, headers=self._headers(), json={"color": preset})
                 logger.info(f"Updated category '{name}' color to {color}")
         else:
             # Create new category
-            resp = requests.post(url, headers=self._headers(), json={
+            resp = self.session.post(url, headers=self._headers(), json={
                 "displayName": name,
                 "color": preset,
             })
@@ -126,9 +154,9 @@ class M365CalendarWriter(CalendarWriter):
         }
         existing = {}
         while url:
-            resp = requests.get(url, headers=self._headers(), params=params)
+            resp = self.session.get(url, headers=self._headers(), params=params)
             resp.raise_for_status()
-            data = resp.json()
+            data = json_utils.loads(resp.content)
             for ev in data.get("value", []):
                 key = (ev.get("subject", ""), ev["start"].get("dateTime", "")[:16])
                 existing[key] = ev["id"]
@@ -175,7 +203,9 @@ class M365CalendarWriter(CalendarWriter):
             else:
                 url = f"{GRAPH_BASE}/{self._user_path}/calendar/events"
 
-            resp = requests.post(url, headers=self._headers(), json=self._to_graph_format(event))
+            resp = self.session.post(
+                url, headers=self._headers(), json=self._to_graph_format(event)
+            )
             resp.raise_for_status()
             event_id = resp.json().get("id", "")
             logger.info(f"Created event: {event.subject}")
@@ -184,6 +214,104 @@ class M365CalendarWriter(CalendarWriter):
         except Exception as e:
             raise CalendarWriteError(f"Failed to create M365 event: {e}") from e
 
+    def create_events_batch(
+        self,
+        events: list[CalendarEvent],
+        calendar_id: Optional[str] = None,
+    ) -> tuple[list[tuple[CalendarEvent, str]], list[tuple[CalendarEvent, str]]]:
+        """Create events using Graph JSON batching, up to 20 per request.
+
+        Every event ends up in exactly one of the returned lists. A failed
+        $batch call only fails the events it carried; events created by
+        earlier calls are still reported as created.
+
+        Args:
+            events: Events to create
+            calendar_id: Optional target calendar ID (default calendar if omitted)
+
+        Returns:
+            Tuple of (list of (event, created event ID), list of (event, error
+            message) for failures)
+        """
+        if calendar_id:
+            url = f"/{self._user_path}/calendars/{calendar_id}/events"
+        else:
+            url = f"/{self._user_path}/calendar/events"
+
+        created: list[tuple[CalendarEvent, str]] = []
+        failed: list[tuple[CalendarEvent, str]] = []
+
+        for offset in range(0, len(events), BATCH_SIZE):
+            # Sub-request ids index into the full chunk so retries keep their mapping
+            chunk = events[offset:offset + BATCH_SIZE]
+            pending = list(range(len(chunk)))
+
+            for attempt in range(BATCH_MAX_RETRIES + 1):
+                payload = {
+                    "requests": [
+                        {
+                            "id": str(i),
+                            "method": "POST",
+                            "url": url,
+                            "headers": {"Content-Type": "application/json"},
+                            "body": self._to_graph_format(chunk[i]),
+                        }
+                        for i in pending
+                    ]
+                }
+                try:
+                    resp = self.session.post(
+                        f"{GRAPH_BASE}/$batch",
+                        headers=self._headers(),
+                        data=json_utils.dumps(payload),
+                    )
+                    resp.raise_for_status()
+                    responses = json_utils.loads(resp.content).get("responses", [])
+                except Exception as e:
+                    message = f"Failed to create M365 events batch: {e}"
+                    failed.extend((chunk[i], message) for i in pending)
+                    break
+
+                unanswered = set(pending)
+                throttled: list[int] = []
+                retry_after = 0.0
+                for item in responses:
+                    try:
+                        i = int(item["id"])
+                    except (KeyError, TypeError, ValueError):
+                        continue
+                    if i not in unanswered:
+                        continue
+                    unanswered.discard(i)
+                    event = chunk[i]
+                    status = item.get("status", 0)
+                    body = item.get("body") or {}
+                    if 200 <= status < 300:
+                        created.append((event, body.get("id", "")))
+                        logger.info(f"Created event: {event.subject}")
+                    elif status in RETRYABLE_STATUSES and attempt < BATCH_MAX_RETRIES:
+                        throttled.append(i)
+                        headers = item.get("headers") or {}
+                        retry_after = max(retry_after, _parse_retry_after(headers))
+                    else:
+                        message = body.get("error", {}).get("message", f"HTTP {status}")
+                        failed.append((event, message))
+
+                # A sub-request without a sub-response has an unknown outcome
+                for i in sorted(unanswered):
+                    failed.append((chunk[i], "No response for this event in the batch"))
+
+                if not throttled:
+                    break
+                delay = retry_after or 2 ** attempt
+                logger.warning(
+                    f"Graph throttled {len(throttled)} batch request(s), retrying in {delay:.0f}s"
+                )
+                time.sleep(delay)
+                pending = throttled
+
+        return created, failed
+
     def update_event(
         self,
         event: CalendarEvent,
@@ -195,7 +323,9 @@ class M365CalendarWriter(CalendarWriter):
             else:
                 url = f"{GRAPH_BASE}/{self._user_path}/calendar/events/{event.id}"
 
-            resp = requests.patch(url, headers=self._headers(), json=self._to_graph_format(event))
+            resp = self.session.patch(
+                url, headers=self._headers(), json=self._to_graph_format(event)
+            )
             resp.raise_for_status()
             logger.info(f"Updated event: {event.subject}")
 
@@ -213,7 +343,7 @@ class M365CalendarWriter(CalendarWriter):
             else:
                 url = f"{GRAPH_BASE}/{self._user_path}/calendar/events/{event_id}"
 
-            resp = requests.delete(url, headers=self._headers())
+            resp = self.session.delete(url, headers=self._headers())
             resp.raise_for_status()
             logger.info(f"Deleted event: {event_id}")
 
@@ -0,0 +1,47 @@
+"""Tests for the in-process YAML parse cache."""
+
+import os
+
+import pytest
+
+from calendar_sync import config
+from calendar_sync.config import _load_yaml
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    config._yaml_cache.clear()
+    yield
+    config._yaml_cache.clear()
+
+
+def test_unchanged_file_reuses_parse(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("accounts:\n  work:\n    type: m365\n")
+
+    first = _load_yaml(path)
+
+    assert first == {"accounts": {"work": {"type": "m365"}}}
+    assert _load_yaml(path) is first
+
+
+def test_changed_file_is_parsed_again(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("sync_days: 7\n")
+    first = _load_yaml(path)
+    st = os.stat(path)
+
+    # Same size and mtime would hide the edit, so move the mtime forward
+    path.write_text("sync_days: 9\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert _load_yaml(path) == {"sync_days": 9}
+    assert first == {"sync_days": 7}
+
+
+def test_empty_file_is_empty_dict(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("")
+
+    assert _load_yaml(path) == {}
+
@@ -0,0 +1,57 @@
+"""Tests for EWS OAuth credentials."""
+
+from exchangelib.protocol import Protocol
+from oauthlib.oauth2 import OAuth2Token
+
+from calendar_sync.auth.ews_auth import EWSAuthProvider
+from calendar_sync.config import EWSConfig
+
+
+def _provider(token: str) -> EWSAuthProvider:
+    """Build a provider without MSAL, handing out a fixed access token."""
+    provider = EWSAuthProvider.__new__(EWSAuthProvider)
+    provider.config = EWSConfig(
+        EWS_SERVER_URL="https://outlook.office365.com/EWS/Exchange.asmx",
+        EWS_CLIENT_ID="client-id",
+        EWS_TENANT_ID="tenant-id",
+        EWS_PRIMARY_EMAIL="user@example.com",
+    )
+    provider._credentials = None
+    provider._credentials_token = None
+    provider.get_access_token = lambda: token
+    return provider
+
+
+class TestGetCredentials:
+    def test_access_token_is_oauth2_token(self):
+        credentials = _provider("token-1").get_credentials()
+
+        assert isinstance(credentials.access_token, OAuth2Token)
+        assert credentials.access_token["access_token"] == "token-1"
+
+    def test_exchangelib_session_sends_bearer_token(self):
+        credentials = _provider("token-1").get_credentials()
+
+        session = Protocol.raw_session(
+            "https://outlook.office365.com/EWS/Exchange.asmx",
+            oauth2_client=credentials.client,
+            oauth2_session_params=credentials.session_params(),
+        )
+        # No token fetch is needed: exchangelib uses the token it was given
+        assert session.token["access_token"] == "token-1"
+        _, headers, _ = credentials.client.add_token(
+            "https://outlook.office365.com/EWS/Exchange.asmx", http_method="POST"
+        )
+        assert headers["Authorization"] == "Bearer token-1"
+
+    def test_credentials_reused_until_token_changes(self):
+        provider = _provider("token-1")
+        first = provider.get_credentials()
+
+        assert provider.get_credentials() is first
+
+        provider.get_access_token = lambda: "token-2"
+        second = provider.get_credentials()
+
+        assert second is not first
+        assert second.sig() != first.sig()
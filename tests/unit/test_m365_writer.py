@@ -0,0 +1,152 @@
+"""Tests for Graph JSON batching in the M365 writer."""
+
+from datetime import datetime
+
+import pytest
+import requests
+
+from calendar_sync.models.event import CalendarEvent
+from calendar_sync.utils import json_utils
+from calendar_sync.writers import m365_writer
+from calendar_sync.writers.m365_writer import M365CalendarWriter, _parse_retry_after
+
+
+class _Auth:
+    use_client_credentials = False
+
+    def get_access_token(self) -> str:
+        return "token"
+
+
+class _Response:
+    def __init__(self, payload=None, error: Exception = None):
+        self.content = json_utils.dumps(payload or {})
+        self._error = error
+
+    def raise_for_status(self) -> None:
+        if self._error:
+            raise self._error
+
+
+class _Session:
+    """Answers each $batch call with the next scripted reply.
+
+    A reply is a callable taking the list of sub-request ids and returning
+    a _Response (or raising).
+    """
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.batches: list[list[str]] = []
+
+    def post(self, url, headers=None, data=None):
+        ids = [r["id"] for r in json_utils.loads(data)["requests"]]
+        self.batches.append(ids)
+        return self.replies.pop(0)(ids)
+
+
+def _ok(ids):
+    return _Response({
+        "responses": [{"id": i, "status": 201, "body": {"id": f"new-{i}"}} for i in ids]
+    })
+
+
+def _events(count: int) -> list[CalendarEvent]:
+    start = datetime(2026, 10, 19, 9, 0)
+    return [
+        CalendarEvent(
+            id=str(i), source_system="ews", subject=f"Event {i}",
+            start=start, end=start.replace(hour=10),
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    delays = []
+    monkeypatch.setattr(m365_writer.time, "sleep", delays.append)
+    return delays
+
+
+class TestCreateEventsBatch:
+    def test_chunks_of_twenty(self, sleeps):
+        session = _Session(_ok, _ok)
+        events = _events(25)
+
+        created, failed = M365CalendarWriter(_Auth(), session=session).create_events_batch(events)
+
+        assert [len(b) for b in session.batches] == [20, 5]
+        assert [e for e, _ in created] == events
+        assert created[20][1] == "new-0"
+        assert failed == []
+        assert sleeps == []
+
+    def test_throttled_requests_retry_after_delay(self, sleeps):
+        def throttled(ids):
+            return _Response({"responses": [
+                {"id": "0", "status": 201, "body": {"id": "new-0"}},
+                {"id": "1", "status": 429, "headers": {"Retry-After": "7"}, "body": {}},
+            ]})
+
+        session = _Session(throttled, _ok)
+        events = _events(2)
+
+        created, failed = M365CalendarWriter(_Auth(), session=session).create_events_batch(events)
+
+        assert session.batches == [["0", "1"], ["1"]]
+        assert sleeps == [7.0]
+        assert created == [(events[0], "new-0"), (events[1], "new-1")]
+        assert failed == []
+
+    def test_throttling_without_retry_after_backs_off(self, sleeps):
+        def throttled(ids):
+            return _Response({"responses": [{"id": i, "status": 503} for i in ids]})
+
+        session = _Session(*[throttled] * (m365_writer.BATCH_MAX_RETRIES + 1))
+        events = _events(1)
+
+        created, failed = M365CalendarWriter(_Auth(), session=session).create_events_batch(events)
+
+        assert sleeps == [1, 2, 4]
+        assert created == []
+        assert failed == [(events[0], "HTTP 503")]
+
+    def test_missing_sub_response_fails_event(self, sleeps):
+        def partial(ids):
+            return _Response({"responses": [
+                {"id": "1", "status": 400, "body": {"error": {"message": "Bad subject"}}},
+            ]})
+
+        session = _Session(partial)
+        events = _events(2)
+
+        created, failed = M365CalendarWriter(_Auth(), session=session).create_events_batch(events)
+
+        assert created == []
+        assert failed == [
+            (events[1], "Bad subject"),
+            (events[0], "No response for this event in the batch"),
+        ]
+
+    def test_failed_batch_keeps_earlier_results(self, sleeps):
+        def broken(ids):
+            return _Response(error=requests.HTTPError("500 Server Error"))
+
+        session = _Session(_ok, broken)
+        events = _events(22)
+
+        created, failed = M365CalendarWriter(_Auth(), session=session).create_events_batch(events)
+
+        assert [e for e, _ in created] == events[:20]
+        assert [e for e, _ in failed] == events[20:]
+        assert "500 Server Error" in failed[0][1]
+
+
+class TestParseRetryAfter:
+    def test_header_name_is_case_insensitive(self):
+        assert _parse_retry_after({"retry-after": "3"}) == 3.0
+
+    def test_missing_or_invalid(self):
+        assert _parse_retry_after({}) == 0.0
+        assert _parse_retry_after({"Retry-After": "soon"}) == 0.0
@@ -0,0 +1,106 @@
+"""Tests for the event filtering and dedup helpers of the CLI."""
+
+import argparse
+from datetime import datetime, timezone
+
+import pytest
+
+from calendar_sync.__main__ import _event_key, _iso_date, _partition_new, _process_events
+from calendar_sync.config import AccountConfig
+from calendar_sync.models.event import CalendarEvent
+
+
+def _event(subject: str, start: datetime, **kwargs) -> CalendarEvent:
+    return CalendarEvent(
+        id=subject,
+        source_system="ews",
+        subject=subject,
+        start=start,
+        end=start.replace(hour=start.hour + 1),
+        **kwargs,
+    )
+
+
+# 2026-10-19 is a Monday
+MONDAY = datetime(2026, 10, 19, 9, 0)
+SATURDAY = datetime(2026, 10, 24, 9, 0)
+
+
+class TestEventKey:
+    def test_ignores_timezone_and_seconds(self):
+        event = _event("Standup", datetime(2026, 10, 19, 9, 0, 42, tzinfo=timezone.utc))
+
+        assert _event_key(event) == ("Standup", "2026-10-19T09:00")
+
+
+class TestProcessEvents:
+    def test_no_filters_keeps_events_untouched(self):
+        events = [_event("Standup", MONDAY)]
+
+        kept = _process_events(events, AccountConfig("work", {}), frozenset())
+
+        assert kept == events
+        assert kept[0].subject == "Standup"
+
+    def test_skip_subjects_is_case_and_space_insensitive(self):
+        events = [_event("  Lunch ", MONDAY), _event("Standup", MONDAY)]
+
+        kept = _process_events(events, AccountConfig("work", {}), frozenset({"lunch"}))
+
+        assert [e.subject for e in kept] == ["Standup"]
+
+    def test_exclude_days(self):
+        account = AccountConfig("work", {"exclude_days": ["Sat", "Sun"]})
+        events = [_event("Weekday", MONDAY), _event("Weekend", SATURDAY)]
+
+        kept = _process_events(events, account, frozenset())
+
+        assert [e.subject for e in kept] == ["Weekday"]
+
+    def test_include_days(self):
+        account = AccountConfig("work", {"include_days": ["Saturday"]})
+        events = [_event("Weekday", MONDAY), _event("Weekend", SATURDAY)]
+
+        kept = _process_events(events, account, frozenset())
+
+        assert [e.subject for e in kept] == ["Weekend"]
+
+    def test_prefix_is_added_once(self):
+        account = AccountConfig("work", {"prefix": "[Work]"})
+        events = [_event("Standup", MONDAY), _event("[Work] Review", MONDAY)]
+
+        kept = _process_events(events, account, frozenset())
+
+        assert [e.subject for e in kept] == ["[Work] Standup", "[Work] Review"]
+
+    def test_category_is_added_once(self):
+        account = AccountConfig("work", {"category": "Work"})
+        events = [_event("Standup", MONDAY), _event("Review", MONDAY, categories=["Work"])]
+
+        kept = _process_events(events, account, frozenset())
+
+        assert [e.categories for e in kept] == [["Work"], ["Work"]]
+
+
+class TestIsoDate:
+    def test_returns_midnight_utc(self):
+        assert _iso_date("2026-02-04") == datetime(2026, 2, 4, tzinfo=timezone.utc)
+
+    @pytest.mark.parametrize("value", ["04.02.2026", "2026-02-30", ""])
+    def test_invalid_dates(self, value):
+        with pytest.raises(argparse.ArgumentTypeError, match="YYYY-MM-DD"):
+            _iso_date(value)
+
+
+class TestPartitionNew:
+    def test_splits_on_existing_keys(self):
+        present = _event("Standup", MONDAY)
+        missing = _event("Review", MONDAY)
+        existing = {_event_key(present)}
+
+        to_create, skipped = _partition_new(
+            [(e, _event_key(e)) for e in (present, missing)], existing
+        )
+
+        assert to_create == [missing]
+        assert skipped == [present]
@@ -0,0 +1,76 @@
+"""Tests for the OWA event label parser and cookie host matching."""
+
+from calendar_sync.auth.selenium_auth import _cookie_matches_host, _parse_event_label
+
+
+class TestParseEventLabel:
+    def test_12h_times_with_organizer_and_recurrence(self):
+        label = (
+            "Standup, 9:30 AM to 10:00 AM, Monday, October 19, 2026, "
+            "By Jane Doe, Recurring event"
+        )
+
+        event = _parse_event_label(label)
+
+        assert event["Subject"] == "Standup"
+        assert event["Start"] == {"DateTime": "2026-10-19T09:30:00", "TimeZone": "UTC"}
+        assert event["End"] == {"DateTime": "2026-10-19T10:00:00", "TimeZone": "UTC"}
+        assert event["Organizer"] == {"EmailAddress": {"Name": "Jane Doe"}}
+        assert event["IsRecurring"] is True
+        assert event["_rawLabel"] == label
+        assert event["_source"] == "dom"
+
+    def test_noon_and_midnight(self):
+        event = _parse_event_label("Lunch, 12:00 PM to 12:30 AM, Friday, March 6, 2026")
+
+        assert event["Start"]["DateTime"] == "2026-03-06T12:00:00"
+        assert event["End"]["DateTime"] == "2026-03-06T00:30:00"
+
+    def test_end_period_applies_to_start_without_one(self):
+        event = _parse_event_label("Review, 1:00 to 2:30 PM, Tuesday, May 5, 2026")
+
+        assert event["Start"]["DateTime"] == "2026-05-05T13:00:00"
+        assert event["End"]["DateTime"] == "2026-05-05T14:30:00"
+
+    def test_24h_times(self):
+        event = _parse_event_label("Planning, 14:00 to 15:30, Wednesday, June 3, 2026")
+
+        assert event["Start"]["DateTime"] == "2026-06-03T14:00:00"
+        assert event["End"]["DateTime"] == "2026-06-03T15:30:00"
+        assert event["Organizer"] is None
+        assert event["IsRecurring"] is False
+
+    def test_24h_morning_times_are_not_shifted(self):
+        event = _parse_event_label("Standup, 9:30 to 10:00, Monday, October 19, 2026")
+
+        assert event["Start"]["DateTime"] == "2026-10-19T09:30:00"
+        assert event["End"]["DateTime"] == "2026-10-19T10:00:00"
+
+    def test_missing_time_spans_whole_day(self):
+        event = _parse_event_label("Offsite, all day, Thursday, July 2, 2026")
+
+        assert event["Start"]["DateTime"] == "2026-07-02T00:00:00"
+        assert event["End"]["DateTime"] == "2026-07-02T23:59:00"
+
+    def test_missing_year_leaves_times_unset(self):
+        event = _parse_event_label("Sync, 9:00 AM to 9:30 AM, Monday, October 19")
+
+        assert event["Subject"] == "Sync"
+        assert event["Start"] is None
+        assert event["End"] is None
+
+    def test_too_few_parts(self):
+        assert _parse_event_label("Standup, 9:30 AM to 10:00 AM, Monday") is None
+
+
+class TestCookieMatchesHost:
+    def test_exact_and_leading_dot(self):
+        assert _cookie_matches_host("mail.example.com", "mail.example.com")
+        assert _cookie_matches_host(".example.com", "mail.example.com")
+
+    def test_ignores_port_and_case(self):
+        assert _cookie_matches_host("Mail.Example.com", "mail.example.com:443")
+
+    def test_other_domains_do_not_match(self):
+        assert not _cookie_matches_host("login.microsoftonline.com", "mail.example.com")
+        assert not _cookie_matches_host("ample.com", "mail.example.com")